@@ -0,0 +1,229 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from string import ascii_uppercase
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battleship.model import TurnAction
+from battleship.boards import DIRECTIONS
+from battleship.knowledge import SCANNED, SHOT
+from battleship.utils import generate_grids_batch
+
+if TYPE_CHECKING:
+    from battleship.model import BattleshipModel
+
+SHOOT, MOVE, SCAN = TurnAction.SHOOT.value, TurnAction.MOVE.value, TurnAction.SCAN.value
+# moves use the event log's encoding, the ship index as the target and the index in DIRECTIONS as i
+_DR = np.array([-1, 1, 0, 0])
+_DC = np.array([0, 0, -1, 1])
+
+
+class BatchEngine:
+    # B games of P players held as arrays, stepped one action per game with the rules of BattleshipModel
+    def __init__(self, games: int, players: int = 2, n: int = 6, k: int = 2, ship_sizes: Sequence[int] = (4, 3, 2, 2), max_powerup_uses: int = 3):
+        self.games = games
+        self.players = players
+        self.n = n
+        self.k = k
+        self.ship_sizes = tuple(ship_sizes)
+        self.max_powerup_uses = max_powerup_uses
+        self.sizes = np.array(self.ship_sizes, dtype=np.int16)
+        ships = len(self.ship_sizes)
+
+        # cells hold ship_index + 1 or 0 for water, sunk ships keep their cells
+        self.boards = np.zeros((games, players, n, n), dtype=np.uint8)
+        self.afloat = np.zeros((games, players, ships), dtype=np.bool_)
+        self.ship_top = np.zeros((games, players, ships), dtype=np.int16)
+        self.ship_left = np.zeros((games, players, ships), dtype=np.int16)
+        self.ship_vertical = np.zeros((games, players, ships), dtype=np.bool_)
+        self.ships_left = np.zeros((games, players), dtype=np.int16)
+        self.players_dead = np.ones((games, players), dtype=np.bool_)
+        self.move_ship_chances = np.zeros((games, players), dtype=np.int16)
+        self.scan_chances = np.zeros((games, players), dtype=np.int16)
+        # knowledge[game, observer, target] holds the KnowledgeMap flags
+        self.knowledge = np.zeros((games, players, players, n, n), dtype=np.uint8)
+        self.turn = np.zeros(games, dtype=np.int64)
+        self.turn_count = np.zeros(games, dtype=np.int64)
+        self._games = np.arange(games)
+
+    def reset(self, seed: int | None = None) -> None:
+        boards = generate_grids_batch(self.games * self.players, self.n, self.ship_sizes, seed)
+        self.boards[...] = boards.reshape(self.boards.shape)
+        self.afloat[...] = True
+        self.move_ship_chances[...] = self.max_powerup_uses
+        self.scan_chances[...] = self.max_powerup_uses
+        self.knowledge[...] = 0
+        self.turn[...] = 0
+        self.turn_count[...] = 0
+        self._index_ships()
+
+    @classmethod
+    def from_models(cls, models: Sequence[BattleshipModel]) -> BatchEngine:
+        # all models must share n, k, ship sizes, powerups and player count
+        first = models[0]
+        engine = cls(len(models), first.players, first.n, first.k, first.ship_sizes, first.max_powerup_uses)
+        n = first.n
+        for g, model in enumerate(models):
+            for p, board in enumerate(model.boards):
+                for r, row in enumerate(board.rows()):
+                    for c, char in enumerate(row):
+                        if char != ".":
+                            engine.boards[g, p, r, c] = ascii_uppercase.index(char.upper()) + 1
+                            engine.afloat[g, p, ascii_uppercase.index(char.upper())] = char.isupper()
+            for (observer, target), cells in model.knowledge.all_maps().items():
+                engine.knowledge[g, observer, target] = np.frombuffer(bytes(cells), dtype=np.uint8).reshape(n, n)
+            engine.move_ship_chances[g] = model.move_ship_chances
+            engine.scan_chances[g] = model.scan_chances
+            engine.turn[g] = model.turn
+            engine.turn_count[g] = model.turn_count
+        engine._index_ships()
+        return engine
+
+    def _index_ships(self) -> None:
+        # derive ship positions and the per-player counters from the boards
+        n = self.n
+        flat = self.boards.reshape(self.games, self.players, n * n)
+        for s in range(len(self.ship_sizes)):
+            first = (flat == s + 1).argmax(axis=2)
+            top, left = first // n, first % n
+            self.ship_top[:, :, s] = top
+            self.ship_left[:, :, s] = left
+            below = np.take_along_axis(flat, (np.minimum(top + 1, n - 1) * n + left)[..., None], axis=2)[..., 0]
+            self.ship_vertical[:, :, s] = (self.ship_sizes[s] > 1) & (top + 1 < n) & (below == s + 1)
+        self.ships_left[...] = self.afloat.sum(axis=2)
+        self.players_dead[...] = self.ships_left == 0
+
+    def active(self) -> NDArray[np.bool_]:
+        # games that are not over yet
+        return (~self.players_dead).sum(axis=1) > 1
+
+    def step(self, action: NDArray[np.integer], target: NDArray[np.integer], i: NDArray[np.integer], j: NDArray[np.integer]) -> NDArray[np.bool_]:
+        # one action per game for the player whose turn it is, then every running game moves to its next turn
+        # returns which games sank a ship this step, finished games are left untouched
+        active = self.active()
+        me = self.turn
+        sank = np.zeros(self.games, dtype=np.bool_)
+
+        g = np.flatnonzero(active & (action == SHOOT))
+        if len(g):
+            t, si, sj = target[g], i[g], j[g]
+            self.knowledge[g, me[g], t, si, sj] |= SHOT
+            ship = self.boards[g, t, si, sj].astype(np.intp) - 1
+            hit = ship >= 0
+            hit[hit] = self.afloat[g[hit], t[hit], ship[hit]]
+            g, t, ship = g[hit], t[hit], ship[hit]
+            self.afloat[g, t, ship] = False
+            self.ships_left[g, t] -= 1
+            self.players_dead[g, t] = self.ships_left[g, t] == 0
+            sank[g] = True
+
+        g = np.flatnonzero(active & (action == SCAN) & (self.scan_chances[self._games, me] > 0))
+        if len(g):
+            self.scan_chances[g, me[g]] -= 1
+            self._reveal_window(g, me[g], target[g], i[g], j[g])
+
+        g = np.flatnonzero(active & (action == MOVE) & (self.move_ship_chances[self._games, me] > 0))
+        if len(g):
+            self._move(g, me[g], target[g].astype(np.intp), i[g].astype(np.intp))
+
+        self._next_turn(active)
+        return sank
+
+    def _reveal_window(self, g: NDArray[np.intp], me: NDArray[np.integer], t: NDArray[np.integer], i: NDArray[np.integer], j: NDArray[np.integer]) -> None:
+        # k x k window with (i, j) as its top-left cell, clipped to the board
+        n = self.n
+        for a in range(self.k):
+            for b in range(self.k):
+                r, c = i + a, j + b
+                inside = (r >= 0) & (r < n) & (c >= 0) & (c < n)
+                self.knowledge[g[inside], me[inside], t[inside], r[inside], c[inside]] |= SCANNED
+
+    def _slide(self, g: NDArray[np.intp], me: NDArray[np.integer], ship: NDArray[np.intp], direction: NDArray[np.intp]) -> tuple[NDArray[np.bool_], NDArray[np.intp], NDArray[np.intp], NDArray[np.intp], NDArray[np.intp]]:
+        # whether each move passes Board.can_move, with the cell the ship moves into and the cell it leaves behind
+        n = self.n
+        size = self.sizes[ship].astype(np.intp)
+        top = self.ship_top[g, me, ship].astype(np.intp)
+        left = self.ship_left[g, me, ship].astype(np.intp)
+        vertical = self.ship_vertical[g, me, ship]
+        dr, dc = _DR[direction], _DC[direction]
+
+        bottom, right = top + (size - 1) * vertical, left + (size - 1) * ~vertical
+        new_r = np.where(dr < 0, top - 1, np.where(dr > 0, bottom + 1, top))
+        new_c = np.where(dc < 0, left - 1, np.where(dc > 0, right + 1, left))
+        old_r = np.where(dr < 0, bottom, top)
+        old_c = np.where(dc < 0, right, left)
+
+        legal = np.asarray(self.afloat[g, me, ship] & (size > 1) & np.where(vertical, dr != 0, dc != 0)
+                           & (new_r >= 0) & (new_r < n) & (new_c >= 0) & (new_c < n), dtype=np.bool_)
+        legal[legal] = self.boards[g[legal], me[legal], new_r[legal], new_c[legal]] == 0
+        return legal, new_r, new_c, old_r, old_c
+
+    def _move(self, g: NDArray[np.intp], me: NDArray[np.integer], ship: NDArray[np.intp], direction: NDArray[np.intp]) -> None:
+        # the model only ever makes legal moves, see BattleshipModel.legal_moves, so an illegal one is a no-op that keeps the chance
+        legal, new_r, new_c, old_r, old_c = self._slide(g, me, ship, direction)
+        g, me, ship, direction = g[legal], me[legal], ship[legal], direction[legal]
+        self.move_ship_chances[g, me] -= 1
+        self.boards[g, me, old_r[legal], old_c[legal]] = 0
+        self.boards[g, me, new_r[legal], new_c[legal]] = ship + 1
+        self.ship_top[g, me, ship] += _DR[direction]
+        self.ship_left[g, me, ship] += _DC[direction]
+
+    def legal_moves(self, g: NDArray[np.intp] | None = None) -> NDArray[np.bool_]:
+        # (len(g), ships, 4) legality of every ship and direction for the player whose turn it is, all games by default
+        g = self._games if g is None else g
+        ships = len(self.ship_sizes)
+        legal = np.zeros((len(g), ships, len(DIRECTIONS)), dtype=np.bool_)
+        for s in range(ships):
+            for d in range(len(DIRECTIONS)):
+                legal[:, s, d] = self._slide(g, self.turn[g], np.full(len(g), s, dtype=np.intp), np.full(len(g), d, dtype=np.intp))[0]
+        return legal
+
+    def _next_turn(self, active: NDArray[np.bool_]) -> None:
+        # next living player in seat order after the current one, as BattleshipModel.go_to_next_turn
+        self.turn_count[active] += 1
+        order = (self.turn[:, None] + np.arange(1, self.players + 1)) % self.players
+        alive = ~self.players_dead[self._games[:, None], order]
+        advance = active & alive.any(axis=1)
+        self.turn[advance] = order[advance, alive[advance].argmax(axis=1)]
+
+    def random_actions(self, rng: np.random.Generator) -> tuple[NDArray[np.int64], NDArray[np.int64], NDArray[np.int64], NDArray[np.int64]]:
+        # the draws of BattleshipModel.get_random_action, get_random_target, get_random_ij and get_random_ship_move
+        # moves are uniform over the legal ones, a game without any gets an illegal move that step ignores
+        games, players, n = self.games, self.players, self.n
+        me = self.turn
+
+        can_move = self.move_ship_chances[self._games, me] > 0
+        can_scan = self.scan_chances[self._games, me] > 0
+        weights = np.stack([np.ones(games, dtype=np.bool_), can_move, can_scan], axis=1) * rng.random((games, 3))
+        action = np.array([SHOOT, MOVE, SCAN])[weights.argmax(axis=1)]
+
+        others = ~self.players_dead.copy()
+        others[self._games, me] = False
+        target = np.asarray((others * rng.random((games, players))).argmax(axis=1), dtype=np.int64)
+        i = rng.integers(0, n, games)
+        j = rng.integers(0, n, games)
+
+        moving = np.flatnonzero(action == MOVE)
+        if len(moving):
+            legal = self.legal_moves(moving).reshape(len(moving), -1)
+            # the highest weight picks uniformly among the legal moves, and the first move when there are none
+            choice = (legal * rng.random(legal.shape) + legal).argmax(axis=1)
+            target[moving], i[moving] = np.divmod(choice, len(DIRECTIONS))
+        return action, target, i, j
+
+    def grids(self, game: int) -> list[list[str]]:
+        # the rows BattleshipModel.grids would return for one game
+        letters = np.array(["."] + list(ascii_uppercase[:len(self.ship_sizes)]))
+        res: list[list[str]] = []
+        for p in range(self.players):
+            cells = letters[self.boards[game, p]]
+            sunk = ~self.afloat[game, p]
+            for s in np.flatnonzero(sunk):
+                cells[self.boards[game, p] == s + 1] = ascii_uppercase[s].lower()
+            res.append(["".join(row) for row in cells])
+        return res
@@ -0,0 +1,42 @@
+# pyright: strict
+
+from __future__ import annotations
+
+# typing.TYPE_CHECKING without importing typing, which alone would blow the package's import budget
+TYPE_CHECKING = False
+
+# names load from their submodule on first use, so importing the package costs next to nothing
+_EXPORTS = {
+    "BattleshipModel": "battleship.model",
+    "BotPlayer": "battleship.model",
+    "HumanPlayer": "battleship.model",
+    "Player": "battleship.model",
+    "PlayerType": "battleship.model",
+    "TurnAction": "battleship.model",
+    "BattleshipView": "battleship.view",
+    "BattleshipController": "battleship.controller",
+}
+
+if TYPE_CHECKING:
+    from battleship.controller import BattleshipController
+    from battleship.model import BattleshipModel, BotPlayer, HumanPlayer, Player, PlayerType, TurnAction
+    from battleship.view import BattleshipView
+
+__all__ = [
+    "BattleshipController",
+    "BattleshipModel",
+    "BattleshipView",
+    "BotPlayer",
+    "HumanPlayer",
+    "Player",
+    "PlayerType",
+    "TurnAction",
+]
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module), name)
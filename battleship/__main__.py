@@ -0,0 +1,46 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import argparse
+import os
+import sys
+
+# subcommands that hand the rest of the command line to another module's own CLI
+TOOLS = {
+    "simulate": "simulate",
+    "serve": "server",
+    "bench": "benchmarks",
+    "tournament": "tournament",
+}
+
+
+def play(profile: str | None) -> None:
+    from battleship.controller import BattleshipController
+    from battleship.model import BattleshipModel
+    from battleship.view import BattleshipView
+
+    profiler = None
+    if profile:
+        from battleship.profiling import PhaseProfiler
+        profiler = PhaseProfiler(profile)
+    BattleshipController(BattleshipModel(), BattleshipView(), profiler).run()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if args and args[0] in TOOLS:
+        from importlib import import_module
+        import_module(TOOLS[args[0]]).main(args[1:], prog=f"python -m battleship {args[0]}")
+        return
+
+    parser = argparse.ArgumentParser(prog="python -m battleship", description=f"Play battleship in the terminal, or run one of: {', '.join(TOOLS)}")
+    parser.add_argument("command", nargs="?", choices=["play"], default="play")
+    parser.add_argument("--profile", default=os.environ.get("BATTLESHIP_PROFILE"), help="write per-phase timings here when the game ends, .json or .prom")
+    parsed = parser.parse_args(args)
+    play(parsed.profile)
+
+
+if __name__ == "__main__":
+    main()
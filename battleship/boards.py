@@ -0,0 +1,392 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from typing import Protocol
+from array import array
+from collections.abc import Sequence
+from enum import Enum
+
+
+class BoardBackend(Enum):
+    LIST = 0
+    BITBOARD = 1
+    COMPACT = 2
+
+
+# a move's index in here is how event logs, the batch engine and the env encode its direction
+DIRECTIONS = "udlr"
+
+
+class Board(Protocol):
+    n: int
+    alive_ships: int
+
+    def rows(self) -> list[str]: ...
+    def cell(self, i: int, j: int) -> str: ...
+    def shoot(self, i: int, j: int) -> str: ...
+    def is_alive(self) -> bool: ...
+    def ships(self) -> list[str]: ...
+    def can_move(self, target_ship: str, move: str) -> bool: ...
+    def legal_moves(self) -> list[tuple[str, str]]: ...
+    def move(self, target_ship: str, move: str) -> None: ...
+
+
+class ShipRecord:
+    def __init__(self, letter: str, cells: list[tuple[int, int]]):
+        self.letter = letter
+        self.cells = sorted(cells)
+        self.alive = letter.isupper()
+        self.top, self.left = self.cells[0]
+        self.bottom, self.right = self.cells[-1]
+        self.orie = "H" if len(self.cells) > 1 and self.top == self.bottom else "V"
+
+    def shift(self, move: str) -> None:
+        dr, dc = {"u": (-1, 0), "d": (1, 0), "l": (0, -1), "r": (0, 1)}[move.lower()]
+        self.cells = [(r + dr, c + dc) for r, c in self.cells]
+        self.top += dr
+        self.bottom += dr
+        self.left += dc
+        self.right += dc
+
+
+class ListBoard:
+    # the original list[list[str]] grid, kept in sync with a registry of its ships
+    def __init__(self, grid: list[list[str]]):
+        self.n = len(grid)
+        self.grid = grid
+        self.registry: dict[str, ShipRecord] = {}
+
+        ship_cells: dict[str, list[tuple[int, int]]] = {}
+        for r, row in enumerate(grid):
+            for c, char in enumerate(row):
+                if char != ".":
+                    ship_cells.setdefault(char, []).append((r, c))
+        for char, cells in ship_cells.items():
+            self.registry[char.upper()] = ShipRecord(char, cells)
+        self.alive_ships = sum(record.alive for record in self.registry.values())
+
+    def rows(self) -> list[str]:
+        return ["".join(row) for row in self.grid]
+
+    def cell(self, i: int, j: int) -> str:
+        return self.grid[i][j]
+
+    def shoot(self, i: int, j: int) -> str:
+        # returns the letter of the ship that got sunk, or "" on a miss
+        shot_char = self.grid[i][j]
+        if not shot_char.isupper():
+            return ""
+        record = self.registry[shot_char]
+        record.alive = False
+        self.alive_ships -= 1
+        sunk_char = shot_char.lower()
+        for r, c in record.cells:
+            self.grid[r][c] = sunk_char
+        return shot_char
+
+    def is_alive(self) -> bool:
+        return self.alive_ships > 0
+
+    def ships(self) -> list[str]:
+        return sorted(ship for ship, record in self.registry.items() if record.alive)
+
+    def can_move(self, target_ship: str, move: str) -> bool:
+        record = self.registry.get(target_ship)
+        # ship not found, sunk or too small
+        if record is None or not record.alive or len(record.cells) < 2:
+            return False
+
+        grid = self.grid
+        move = move.lower()
+        if record.orie == "V":
+            if move == "u" and record.top > 0:
+                return grid[record.top - 1][record.left] == "."
+            if move == "d" and record.bottom < self.n - 1:
+                return grid[record.bottom + 1][record.left] == "."
+        else:
+            if move == "l" and record.left > 0:
+                return grid[record.top][record.left - 1] == "."
+            if move == "r" and record.right < self.n - 1:
+                return grid[record.top][record.right + 1] == "."
+
+        return False
+
+    def legal_moves(self) -> list[tuple[str, str]]:
+        # every afloat ship can only slide along its own axis, two checks per ship
+        moves: list[tuple[str, str]] = []
+        for ship in self.ships():
+            for move in ("ud" if self.registry[ship].orie == "V" else "lr"):
+                if self.can_move(ship, move):
+                    moves.append((ship, move))
+        return moves
+
+    def move(self, target_ship: str, move: str) -> None:
+        # an illegal move, of a sunk ship too, leaves the board as it was
+        if not self.can_move(target_ship, move):
+            return
+        record = self.registry[target_ship]
+        for r, c in record.cells:
+            self.grid[r][c] = "."
+        record.shift(move)
+        for r, c in record.cells:
+            self.grid[r][c] = target_ship
+
+
+class BitBoard:
+    # one n-bit occupancy mask per row, and one mask per ship along its own row or column
+    # a board-wide n * n bit mask costs O(n^2 / 30) per operation, these never go past n bits
+    def __init__(self, n: int):
+        self.n = n
+        # bit c of occupied[r] is set when a ship, afloat or sunk, covers (r, c)
+        self.occupied = [0] * n
+        # the row of a horizontal ship or the column of a vertical one, and the bits it covers along it
+        self.ship_line: dict[str, int] = {}
+        self.ship_masks: dict[str, int] = {}
+        self.ship_orie: dict[str, str] = {}
+        self.sunk: set[str] = set()
+        self.alive_ships = 0
+
+    @classmethod
+    def from_grid(cls, grid: Sequence[Sequence[str]]) -> BitBoard:
+        board = cls(len(grid))
+        ship_cells: dict[str, list[tuple[int, int]]] = {}
+        for r, row in enumerate(grid):
+            for c, char in enumerate(row):
+                if char == ".":
+                    continue
+                ship = char.upper()
+                ship_cells.setdefault(ship, []).append((r, c))
+                board.occupied[r] |= 1 << c
+                if not char.isupper():
+                    board.sunk.add(ship)
+
+        for ship, cells in ship_cells.items():
+            # same rule as ShipRecord, a single cell counts as vertical
+            horizontal = len(cells) > 1 and cells[0][0] == cells[-1][0]
+            board.ship_orie[ship] = "H" if horizontal else "V"
+            board.ship_line[ship] = cells[0][0] if horizontal else cells[0][1]
+            mask = 0
+            for r, c in cells:
+                mask |= 1 << (c if horizontal else r)
+            board.ship_masks[ship] = mask
+
+        board.alive_ships = len(board.ship_masks) - len(board.sunk)
+        return board
+
+    def _ship_at(self, i: int, j: int) -> str:
+        if not self.occupied[i] >> j & 1:
+            return ""
+        for ship, mask in self.ship_masks.items():
+            if self.ship_orie[ship] == "H":
+                if self.ship_line[ship] == i and mask >> j & 1:
+                    return ship
+            elif self.ship_line[ship] == j and mask >> i & 1:
+                return ship
+        return ""
+
+    def rows(self) -> list[str]:
+        n = self.n
+        cells = bytearray(b"." * (n * n))
+        for ship, mask in self.ship_masks.items():
+            char = ord(ship.lower() if ship in self.sunk else ship)
+            line = self.ship_line[ship]
+            # a horizontal ship's bits are columns of its row, a vertical one's are rows of its column
+            base, step = (line * n, 1) if self.ship_orie[ship] == "H" else (line, n)
+            while mask:
+                low = mask & -mask
+                cells[base + (low.bit_length() - 1) * step] = char
+                mask ^= low
+        return [cells[r * n:(r + 1) * n].decode() for r in range(n)]
+
+    def cell(self, i: int, j: int) -> str:
+        ship = self._ship_at(i, j)
+        if not ship:
+            return "."
+        return ship.lower() if ship in self.sunk else ship
+
+    def shoot(self, i: int, j: int) -> str:
+        ship = self._ship_at(i, j)
+        if not ship or ship in self.sunk:
+            return ""
+        self.sunk.add(ship)
+        self.alive_ships -= 1
+        return ship
+
+    def is_alive(self) -> bool:
+        return self.alive_ships > 0
+
+    def ships(self) -> list[str]:
+        return sorted(ship for ship in self.ship_masks if ship not in self.sunk)
+
+    def _target(self, target_ship: str, move: str) -> tuple[int, int, int, int]:
+        # the cell the ship moves into and the cell it leaves, or a row of -1 if it would leave the board
+        mask = self.ship_masks[target_ship]
+        line = self.ship_line[target_ship]
+        low, high = (mask & -mask).bit_length() - 1, mask.bit_length() - 1
+        move = move.lower()
+        if self.ship_orie[target_ship] == "V":
+            if move == "u" and low > 0:
+                return low - 1, line, high, line
+            if move == "d" and high < self.n - 1:
+                return high + 1, line, low, line
+        else:
+            if move == "l" and low > 0:
+                return line, low - 1, line, high
+            if move == "r" and high < self.n - 1:
+                return line, high + 1, line, low
+        return -1, -1, -1, -1
+
+    def can_move(self, target_ship: str, move: str) -> bool:
+        if target_ship not in self.ship_masks or target_ship in self.sunk:
+            return False
+        if self.ship_masks[target_ship].bit_count() < 2:
+            return False
+        r, c, _, _ = self._target(target_ship, move)
+        return r >= 0 and not self.occupied[r] >> c & 1
+
+    def legal_moves(self) -> list[tuple[str, str]]:
+        moves: list[tuple[str, str]] = []
+        for ship in self.ships():
+            for move in ("ud" if self.ship_orie[ship] == "V" else "lr"):
+                if self.can_move(ship, move):
+                    moves.append((ship, move))
+        return moves
+
+    def move(self, target_ship: str, move: str) -> None:
+        if not self.can_move(target_ship, move):
+            return
+        r, c, back_r, back_c = self._target(target_ship, move)
+        self.occupied[r] |= 1 << c
+        self.occupied[back_r] &= ~(1 << back_c)
+        mask = self.ship_masks[target_ship]
+        self.ship_masks[target_ship] = mask >> 1 if move.lower() in "ul" else mask << 1
+
+
+class CompactBoard:
+    # one byte per cell and a few array entries per ship, no per-ship objects and no __dict__
+    # for keeping many matches resident, ship slots are indexed by letter, A = 0
+    __slots__ = ("n", "cells", "starts", "sizes", "vertical", "alive_ships")
+
+    def __init__(self, n: int, cells: bytearray, starts: array[int], sizes: array[int], vertical: bytearray):
+        self.n = n
+        self.cells = cells
+        # top-left cell r * n + c of each ship, 0 size marks an unused letter
+        self.starts = starts
+        self.sizes = sizes
+        self.vertical = vertical
+        self.alive_ships = sum(1 for s, size in enumerate(sizes) if size and cells[starts[s]] < _LOWER_A)
+
+    @classmethod
+    def from_grid(cls, grid: Sequence[Sequence[str]]) -> CompactBoard:
+        n = len(grid)
+        cells = bytearray("".join("".join(row) for row in grid).encode())
+        letters = max((c & ~_CASE_BIT) - _UPPER_A + 1 for c in set(cells) - {_WATER}) if cells.strip(b".") else 0
+        starts = array("I", [0] * letters)
+        sizes = array("I", [0] * letters)
+        vertical = bytearray(letters)
+        for idx, char in enumerate(cells):
+            if char == _WATER:
+                continue
+            s = (char & ~_CASE_BIT) - _UPPER_A
+            if not sizes[s]:
+                starts[s] = idx
+            elif sizes[s] == 1 and idx // n != starts[s] // n:
+                vertical[s] = 1
+            sizes[s] += 1
+        return cls(n, cells, starts, sizes, vertical)
+
+    def _ship_cells(self, s: int) -> range:
+        step = self.n if self.vertical[s] else 1
+        start = self.starts[s]
+        return range(start, start + step * self.sizes[s], step)
+
+    def _slot(self, target_ship: str) -> int:
+        # the ship's index, or -1 when there is no such ship
+        if len(target_ship) != 1:
+            return -1
+        s = ord(target_ship) - _UPPER_A
+        return s if 0 <= s < len(self.sizes) and self.sizes[s] else -1
+
+    def rows(self) -> list[str]:
+        n = self.n
+        return [self.cells[r * n:(r + 1) * n].decode() for r in range(n)]
+
+    def cell(self, i: int, j: int) -> str:
+        return chr(self.cells[i * self.n + j])
+
+    def shoot(self, i: int, j: int) -> str:
+        char = self.cells[i * self.n + j]
+        if not _UPPER_A <= char < _UPPER_A + 26:
+            return ""
+        sunk = char | _CASE_BIT
+        for idx in self._ship_cells(char - _UPPER_A):
+            self.cells[idx] = sunk
+        self.alive_ships -= 1
+        return chr(char)
+
+    def is_alive(self) -> bool:
+        return self.alive_ships > 0
+
+    def ships(self) -> list[str]:
+        cells, starts = self.cells, self.starts
+        return [chr(_UPPER_A + s) for s, size in enumerate(self.sizes) if size and cells[starts[s]] < _LOWER_A]
+
+    def _target(self, s: int, move: str) -> int:
+        # the cell the ship moves into, or -1 if it would leave the board or slide across its axis
+        n, start, size = self.n, self.starts[s], self.sizes[s]
+        r, c = divmod(start, n)
+        if self.vertical[s]:
+            if move == "u" and r > 0:
+                return start - n
+            if move == "d" and r + size < n:
+                return start + size * n
+        else:
+            if move == "l" and c > 0:
+                return start - 1
+            if move == "r" and c + size < n:
+                return start + size
+        return -1
+
+    def can_move(self, target_ship: str, move: str) -> bool:
+        s = self._slot(target_ship)
+        # ship not found, sunk or too small
+        if s < 0 or self.sizes[s] < 2 or self.cells[self.starts[s]] >= _LOWER_A:
+            return False
+        idx = self._target(s, move.lower())
+        return idx >= 0 and self.cells[idx] == _WATER
+
+    def legal_moves(self) -> list[tuple[str, str]]:
+        moves: list[tuple[str, str]] = []
+        for ship in self.ships():
+            for move in ("ud" if self.vertical[ord(ship) - _UPPER_A] else "lr"):
+                if self.can_move(ship, move):
+                    moves.append((ship, move))
+        return moves
+
+    def move(self, target_ship: str, move: str) -> None:
+        if not self.can_move(target_ship, move):
+            return
+        s = self._slot(target_ship)
+        move = move.lower()
+        idx = self._target(s, move)
+        # one cell is vacated at the back and one taken at the front
+        cells = self._ship_cells(s)
+        back = cells[-1] if move in "ul" else cells[0]
+        self.cells[idx] = self.cells[back]
+        self.cells[back] = _WATER
+        self.starts[s] += (self.n if self.vertical[s] else 1) * (-1 if move in "ul" else 1)
+
+
+_WATER = ord(".")
+_UPPER_A = ord("A")
+_LOWER_A = ord("a")
+_CASE_BIT = 0x20
+
+
+def make_board(grid: list[list[str]], backend: BoardBackend = BoardBackend.LIST) -> Board:
+    if backend == BoardBackend.BITBOARD:
+        return BitBoard.from_grid(grid)
+    if backend == BoardBackend.COMPACT:
+        return CompactBoard.from_grid(grid)
+    return ListBoard(grid)
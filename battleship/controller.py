@@ -0,0 +1,205 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from battleship.model import BattleshipModel, PlayerType
+from battleship.view import BattleshipView
+
+if TYPE_CHECKING:
+    from battleship.profiling import PhaseProfiler
+
+class BattleshipController:
+    def __init__(self, model: BattleshipModel, view: BattleshipView, profiler: PhaseProfiler | None = None):
+        self._model = model
+        self._view = view
+        # optional per-phase timings, see profiling.py
+        self._profiler = profiler
+
+    def run(self) -> None:
+        model = self._model
+        view = self._view
+
+        # Setup: Set n size of grid, and k size of scans
+        model.n = view.ask_n_size()
+        model.k = view.ask_k_size()
+
+        # Setup: Set no. of players, and if humans or bots
+        # initialize for pyright
+        player_1: PlayerType = PlayerType.BOT
+        player_2: PlayerType = PlayerType.BOT
+        i: int = 0
+        j: int = 0
+        target: int = 1
+        decision: str = 'a'
+        target_ship: str = ""
+        movement: str = ""
+
+        # MODIFIED PLAYER GRIDS
+        model.setup(view.ask_num_players())
+
+        player_0 = PlayerType.HUMAN
+        if model.players == 2:
+            player_1 = view.is_human_or_bot(1)
+        elif model.players == 3:
+            player_1 = view.is_human_or_bot(1)
+            player_2 = view.is_human_or_bot(2)
+
+        if self._profiler is not None:
+            self._profiler.instrument(model, view, [player_0, player_1, player_2][:model.players])
+
+        # Game loop
+        while not model.is_game_over():
+            view.whos_turn_is_it(model.turn, model.move_ship_chances, model.scan_chances)
+            # [2 players mode]
+            if model.players == 2:
+                # Player 0
+                if model.turn == 0:
+                    view.show_grids(model.grids(), model.turn, model.knowledge, model.n)
+                    target = 1
+                    # decide action
+                    decision = view.ask_what_action(PlayerType.HUMAN, model.turn)
+                    if decision == 'a':
+                        i, j = view.ask_for_location(model.n)
+                    elif decision == 'b':
+                        target_ship, movement = view.ask_what_to_move(PlayerType.HUMAN, model.turn, model.legal_moves())
+                        if target_ship and movement:
+                            model.move_ship((target_ship, movement))
+                    elif decision == 'c':
+                        i, j = view.ask_for_top_left_scan_point(model.n)
+                        model.scan(i, j, target)
+                # Player 1
+                else:
+                    # Human P1
+                    if player_1 == PlayerType.HUMAN:
+                        view.show_grids(model.grids(), model.turn, model.knowledge, model.n)
+                        target = 0
+                        # decide action
+                        decision = view.ask_what_action(PlayerType.HUMAN, model.turn)
+                        if decision == 'a':
+                            i, j = view.ask_for_location(model.n)
+                        elif decision == 'b':
+                            target_ship, movement = view.ask_what_to_move(PlayerType.HUMAN, model.turn, model.legal_moves())
+                            if target_ship and movement:
+                                model.move_ship((target_ship, movement))
+                        elif decision == 'c':
+                            i, j = view.ask_for_top_left_scan_point(model.n)
+                            model.scan(i, j, target)
+                    # Bot P1
+                    else:
+                        # decide action
+                        decision = view.ask_what_action(PlayerType.BOT, model.turn)
+                        if decision == 'a':
+                            target = 0
+                            i, j = model.get_untried_ij(target)
+                            view.show_shot(i, j, model.turn)
+                        elif decision == 'b':
+                            target_ship, movement = model.get_random_ship_move()
+                            if target_ship and movement:
+                                model.move_ship((target_ship, movement))
+                        elif decision == 'c':
+                            target = model.get_random_target()
+                            i, j = model.get_random_ij()
+                            model.scan(i, j, target)
+
+            # [3 players mode]
+            else:
+                # Player 0
+                if model.turn == 0:
+                    view.show_grids(model.grids(), model.turn, model.knowledge, model.n)
+
+                    # decide action
+
+                    decision = view.ask_what_action(PlayerType.HUMAN, model.turn)
+                    if decision == 'a':
+                        target = view.ask_who_to_shoot(model.players, model.turn)
+                        i, j = view.ask_for_location(model.n)
+                    elif decision == 'b':
+                        target_ship, movement = view.ask_what_to_move(PlayerType.HUMAN, model.turn, model.legal_moves())
+                        if target_ship and movement:
+                            model.move_ship((target_ship, movement))
+                    elif decision == 'c':
+                        target = view.ask_who_to_scan(model.players, model.turn)
+                        i, j = view.ask_for_top_left_scan_point(model.n)
+                        model.scan(i, j, target)
+                # PLayer 1
+                elif model.turn == 1:
+                    # Human P1
+                    if player_1 == PlayerType.HUMAN:
+                        view.show_grids(model.grids(), model.turn, model.knowledge, model.n)
+                        
+                        # decide action
+                        decision = view.ask_what_action(PlayerType.HUMAN, model.turn)
+                        if decision == 'a':
+                            target = view.ask_who_to_shoot(model.players, model.turn)
+                            i, j = view.ask_for_location(model.n)
+                        elif decision == 'b':
+                            target_ship, movement = view.ask_what_to_move(PlayerType.HUMAN, model.turn, model.legal_moves())
+                            if target_ship and movement:
+                                model.move_ship((target_ship, movement))
+                        elif decision == 'c':
+                            target = view.ask_who_to_scan(model.players, model.turn)
+                            i, j = view.ask_for_top_left_scan_point(model.n)
+                            model.scan(i, j, target)
+                    # Bot P1
+                    else:
+                        # decide action
+                        decision = view.ask_what_action(PlayerType.BOT, model.turn)
+                        if decision == 'a':
+                            target = model.get_random_target()
+                            i, j = model.get_untried_ij(target)
+                            view.show_shot(i, j, model.turn)
+                        elif decision == 'b':
+                            target_ship, movement = model.get_random_ship_move()
+                            if target_ship and movement:
+                                model.move_ship((target_ship, movement))
+                        elif decision == 'c':
+                            target = model.get_random_target()
+                            i, j = model.get_random_ij()
+                            model.scan(i, j, target)
+                # Player 2
+                else:
+                    # Human P2
+                    if player_2 == PlayerType.HUMAN:
+                        view.show_grids(model.grids(), model.turn, model.knowledge, model.n)
+                        
+                        # decide action
+                        decision = view.ask_what_action(PlayerType.HUMAN, model.turn)
+                        if decision == 'a':
+                            target = view.ask_who_to_shoot(model.players, model.turn)
+                            i, j = view.ask_for_location(model.n)
+                        elif decision == 'b':
+                            target_ship, movement = view.ask_what_to_move(PlayerType.HUMAN, model.turn, model.legal_moves())
+                            if target_ship and movement:
+                                model.move_ship((target_ship, movement))
+                        elif decision == 'c':
+                            target = view.ask_who_to_scan(model.players, model.turn)
+                            i, j = view.ask_for_top_left_scan_point(model.n)
+                            model.scan(i, j, target)
+                    # Bot P2
+                    else:
+                        # decide action
+                        decision = view.ask_what_action(PlayerType.BOT, model.turn)
+                        if decision == 'a':
+                            target = model.get_random_target()
+                            i, j = model.get_untried_ij(target)
+                            view.show_shot(i, j, model.turn)
+                        elif decision == 'b':
+                            target_ship, movement = model.get_random_ship_move()
+                            if target_ship and movement:
+                                model.move_ship((target_ship, movement))
+                        elif decision == 'c':
+                            target = model.get_random_target()
+                            i, j = model.get_random_ij()
+                            model.scan(i, j, target)
+            view.show_grids(model.grids(), model.turn, model.knowledge, model.n)
+
+            if decision == 'a':            
+                model.shoot(i, j, target)
+            model.go_to_next_turn()
+
+        
+        view.show_final_grids(model.grids(), model.turn, model.knowledge, model.n)
+        view.show_end_message(model.winner())
+        if self._profiler is not None:
+            self._profiler.finish()
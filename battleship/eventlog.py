@@ -0,0 +1,185 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from random import Random
+from string import ascii_uppercase
+import struct
+
+from battleship.model import BattleshipModel, TurnAction
+from battleship.boards import DIRECTIONS, BoardBackend, make_board
+from battleship.knowledge import UntriedCells
+
+MAGIC = b"BSEV"
+VERSION = 2
+# magic, version, n, k, players, max powerup uses, board backend
+HEADER = struct.Struct("<4sBHHHHB")
+# turn, player, target (ship index for moves), i (direction for moves), j, action
+RECORD = struct.Struct("<IHHHHBx")
+# turn, length of the encoded state that follows
+SNAPSHOT = struct.Struct("<II")
+
+
+def encode_state(model: BattleshipModel) -> bytes:
+    # everything a replay needs to continue from this turn, the rng is not needed
+    parts = [struct.pack("<IHH", model.turn_count, model.turn, model.players)]
+    parts.append(array("i", model.move_ship_chances).tobytes())
+    parts.append(array("i", model.scan_chances).tobytes())
+    for board in model.boards:
+        parts.append("".join(board.rows()).encode())
+    maps = model.knowledge.all_maps()
+    parts.append(struct.pack("<I", len(maps)))
+    for (observer, target), cells in sorted(maps.items()):
+        parts.append(struct.pack("<HH", observer, target))
+        parts.append(bytes(cells))
+    parts.append(struct.pack("<I", len(model.untried)))
+    for (shooter, target), pool in sorted(model.untried.items()):
+        parts.append(struct.pack("<HH", shooter, target))
+        parts.append(pool.pack())
+    return b"".join(parts)
+
+
+def decode_state(model: BattleshipModel, data: bytes | memoryview) -> None:
+    # model must already have the logged n, k, ship sizes and backend
+    n = model.n
+    model.turn_count, model.turn, players = struct.unpack_from("<IHH", data)
+    model.players = players
+    offset = 8
+    counters = array("i")
+    counters.frombytes(bytes(data[offset:offset + 8 * players]))
+    model.move_ship_chances = list(counters[:players])
+    model.scan_chances = list(counters[players:])
+    offset += 8 * players
+
+    model.boards = []
+    for _ in range(players):
+        cells = bytes(data[offset:offset + n * n]).decode()
+        model.boards.append(make_board([list(cells[r * n:(r + 1) * n]) for r in range(n)], model.backend))
+        offset += n * n
+    model._index_players()  # pyright: ignore[reportPrivateUsage]
+
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    model.knowledge.maps.clear()
+    model.knowledge.packed.clear()
+    for _ in range(count):
+        observer, target = struct.unpack_from("<HH", data, offset)
+        model.knowledge.maps[(observer, target)] = bytearray(data[offset + 4:offset + 4 + n * n])
+        offset += 4 + n * n
+
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    model.untried = {}
+    for _ in range(count):
+        shooter, target = struct.unpack_from("<HH", data, offset)
+        model.untried[(shooter, target)], offset = UntriedCells.unpack(n * n, data, offset + 4)
+
+
+class EventLog:
+    # append-only action log, with the full state written to path + ".snap" every snapshot_every turns
+    def __init__(self, path: str, model: BattleshipModel, seed: int | str, snapshot_every: int = 1000):
+        self.path = path
+        self.snapshot_every = snapshot_every
+        self._log = open(path, "wb")
+        self._snapshots = open(path + ".snap", "wb")
+
+        seed_bytes = str(seed).encode()
+        self._log.write(HEADER.pack(MAGIC, VERSION, model.n, model.k, model.players, model.max_powerup_uses, model.backend.value))
+        self._log.write(struct.pack(f"<H{len(model.ship_sizes)}H", len(model.ship_sizes), *model.ship_sizes))
+        self._log.write(struct.pack("<H", len(seed_bytes)) + seed_bytes)
+
+        self.snapshot(model)
+        model.event_log = self
+
+    def record(self, turn: int, action: TurnAction, player: int, target: int, i: int, j: int) -> None:
+        self._log.write(RECORD.pack(turn, player, target, i, j, action.value))
+
+    def record_move(self, turn: int, player: int, target_ship: str, movement: str) -> None:
+        self.record(turn, TurnAction.MOVE, player, ascii_uppercase.index(target_ship), DIRECTIONS.index(movement.lower()), 0)
+
+    def snapshot(self, model: BattleshipModel) -> None:
+        state = encode_state(model)
+        self._snapshots.write(SNAPSHOT.pack(model.turn_count, len(state)) + state)
+
+    def on_turn(self, model: BattleshipModel) -> None:
+        if model.turn_count % self.snapshot_every == 0:
+            self.snapshot(model)
+
+    def close(self) -> None:
+        self._log.close()
+        self._snapshots.close()
+
+
+class Replay:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.n, self.k, self.players, self.max_powerup_uses, backend = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} battleship event log")
+        self.backend = BoardBackend(backend)
+        offset = HEADER.size
+        (ships,) = struct.unpack_from("<H", data, offset)
+        self.ship_sizes: tuple[int, ...] = struct.unpack_from(f"<{ships}H", data, offset + 2)
+        offset += 2 + 2 * ships
+        (seed_len,) = struct.unpack_from("<H", data, offset)
+        self.seed = data[offset + 2:offset + 2 + seed_len].decode()
+        offset += 2 + seed_len
+
+        # records are fixed width, a trailing partial record from a crash is ignored
+        self._records = memoryview(data)[offset:]
+        self.records = len(self._records) // RECORD.size
+
+        with open(path + ".snap", "rb") as f:
+            self._snapshot_data = f.read()
+        self._snapshot_turns: list[int] = []
+        self._snapshot_offsets: list[int] = []
+        pos = 0
+        while pos + SNAPSHOT.size <= len(self._snapshot_data):
+            turn, length = SNAPSHOT.unpack_from(self._snapshot_data, pos)
+            self._snapshot_turns.append(turn)
+            self._snapshot_offsets.append(pos + SNAPSHOT.size)
+            pos += SNAPSHOT.size + length
+
+    def record(self, idx: int) -> tuple[int, TurnAction, int, int, int, int]:
+        turn, player, target, i, j, action = RECORD.unpack_from(self._records, idx * RECORD.size)
+        return turn, TurnAction(action), player, target, i, j
+
+    def _turn_of(self, idx: int) -> int:
+        return RECORD.unpack_from(self._records, idx * RECORD.size)[0]
+
+    def model_at(self, turn: int) -> BattleshipModel:
+        # the state at the start of the given turn, restored from the closest snapshot before it
+        snap = bisect_right(self._snapshot_turns, turn) - 1
+        if snap < 0:
+            raise ValueError(f"No snapshot at or before turn {turn}")
+        model = BattleshipModel(n=self.n, k=self.k, ship_sizes=self.ship_sizes, rng=Random(self.seed), players=self.players, max_powerup_uses=self.max_powerup_uses, backend=self.backend)
+        offset = self._snapshot_offsets[snap]
+        decode_state(model, memoryview(self._snapshot_data)[offset:])
+
+        first = bisect_left(range(self.records), model.turn_count, key=self._turn_of)
+        last = bisect_left(range(self.records), turn, key=self._turn_of)
+        for idx in range(first, last):
+            rec_turn, action, player, target, i, j = self.record(idx)
+            while model.turn_count < rec_turn:
+                model.go_to_next_turn()
+            model.turn = player
+            apply_record(model, action, target, i, j)
+        while model.turn_count < turn:
+            model.go_to_next_turn()
+        return model
+
+    def actions(self) -> Sequence[tuple[int, TurnAction, int, int, int, int]]:
+        return [self.record(idx) for idx in range(self.records)]
+
+
+def apply_record(model: BattleshipModel, action: TurnAction, target: int, i: int, j: int) -> None:
+    if action == TurnAction.SHOOT:
+        model.shoot(i, j, target)
+    elif action == TurnAction.SCAN:
+        model.scan(i, j, target)
+    else:
+        model.move_ship((ascii_uppercase[target], DIRECTIONS[i]))
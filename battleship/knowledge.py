@@ -0,0 +1,156 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from array import array
+from random import Random
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import mmap
+
+# cell flags, a cell is revealed to the observer once any flag is set
+SHOT = 1
+SCANNED = 2
+
+
+class KnowledgeMap:
+    # one byte per cell for every (observer, target) pair, allocated on first reveal
+    def __init__(self, n: int):
+        self.n = n
+        self.maps: dict[tuple[int, int], bytearray] = {}
+        # maps loaded from a snapshot, 2 bits per cell, unpacked on first use, see snapshot.py
+        self.packed: dict[tuple[int, int], bytes | memoryview] = {}
+        # the memory-mapped snapshot file the packed maps point into, if loaded lazily
+        self.mapped: mmap.mmap | None = None
+        self._unseen_row = bytes(n)
+
+    def _get(self, observer: int, target: int) -> bytearray | None:
+        cells = self.maps.get((observer, target))
+        if cells is None and self.packed:
+            data = self.packed.pop((observer, target), None)
+            if data is not None:
+                cells = self.maps[(observer, target)] = unpack_cells(data, self.n * self.n)
+                if not self.packed:
+                    # the last map is out, so the mapped file and its descriptor can go
+                    del data
+                    self.release()
+        return cells
+
+    def _map(self, observer: int, target: int) -> bytearray:
+        cells = self._get(observer, target)
+        if cells is None:
+            cells = self.maps[(observer, target)] = bytearray(self.n * self.n)
+        return cells
+
+    def release(self) -> None:
+        # copy maps still pending out of the mapped file and close it, e.g. before the file is rewritten
+        if self.mapped is None:
+            return
+        self.packed = {pair: bytes(data) for pair, data in self.packed.items()}
+        self.mapped.close()
+        self.mapped = None
+
+    def all_maps(self) -> dict[tuple[int, int], bytearray]:
+        for observer, target in list(self.packed):
+            self._get(observer, target)
+        return self.maps
+
+    def reveal(self, observer: int, target: int, i: int, j: int, flag: int = SHOT) -> None:
+        self._map(observer, target)[i * self.n + j] |= flag
+
+    def reveal_window(self, observer: int, target: int, i: int, j: int, k: int, flag: int = SCANNED) -> None:
+        # k x k window with (i, j) as its top-left cell, clipped to the board
+        n = self.n
+        cells = self._map(observer, target)
+        c0, c1 = max(j, 0), min(j + k, n)
+        if c0 >= c1:
+            return
+        for r in range(max(i, 0), min(i + k, n)):
+            start = r * n
+            cells[start + c0:start + c1] = bytes(b | flag for b in cells[start + c0:start + c1])
+
+    def flags(self, observer: int, target: int, i: int, j: int) -> int:
+        cells = self._get(observer, target)
+        return cells[i * self.n + j] if cells is not None else 0
+
+    def is_revealed(self, observer: int, target: int, i: int, j: int) -> bool:
+        return self.flags(observer, target, i, j) != 0
+
+    def row(self, observer: int, target: int, r: int) -> bytes | bytearray:
+        cells = self._get(observer, target)
+        if cells is None:
+            return self._unseen_row
+        return cells[r * self.n:(r + 1) * self.n]
+
+    def revealed(self, observer: int, target: int) -> list[tuple[int, int]]:
+        cells = self._get(observer, target)
+        if cells is None:
+            return []
+        n = self.n
+        return [divmod(idx, n) for idx, b in enumerate(cells) if b]
+
+
+def pack_cells(cells: bytes | bytearray) -> bytes:
+    # four 2-bit flag cells per byte, the first cell in the low bits
+    padded = bytes(cells) + bytes(-len(cells) % 4)
+    return bytes(padded[i] | padded[i + 1] << 2 | padded[i + 2] << 4 | padded[i + 3] << 6 for i in range(0, len(padded), 4))
+
+
+def unpack_cells(data: bytes | memoryview, size: int) -> bytearray:
+    return bytearray(b"".join([_UNPACKED[b] for b in data])[:size])
+
+
+_UNPACKED = [bytes((b >> shift) & 3 for shift in (0, 2, 4, 6)) for b in range(256)]
+
+
+class UntriedCells:
+    # cells r * n + c not yet tried, drawn without repeats by a lazy Fisher-Yates shuffle
+    # only positions that were swapped are stored, so a fresh pool costs nothing
+    # the pool only changes through discard, so replaying the shots and scans rebuilds it exactly
+    def __init__(self, size: int):
+        self.size = size
+        self.remaining = size
+        self._at: dict[int, int] = {}
+        self._where: dict[int, int] = {}
+
+    def discard(self, cell: int) -> None:
+        idx = self._where.get(cell, cell)
+        if idx >= self.remaining:
+            return
+        last = self.remaining - 1
+        last_cell = self._at.get(last, last)
+        # the last live cell takes this one's place, this one parks past the end
+        self._at[idx] = last_cell
+        self._where[last_cell] = idx
+        self._at[last] = cell
+        self._where[cell] = last
+        # every cell has been tried, e.g. a ship moved onto one, so start a fresh round
+        self.remaining = last if last else self.size
+
+    def draw(self, rng: Random) -> int:
+        # the caller discards the cell once it is actually tried
+        idx = rng.randrange(self.remaining)
+        return self._at.get(idx, idx)
+
+    def pack(self) -> bytes:
+        # remaining, swapped position count, then (position, cell) pairs
+        swapped = array("I", [value for item in sorted(self._at.items()) for value in item])
+        return UNTRIED_HEADER.pack(self.remaining, len(self._at)) + swapped.tobytes()
+
+    @classmethod
+    def unpack(cls, size: int, data: bytes | memoryview, offset: int = 0) -> tuple[UntriedCells, int]:
+        # the pool and the offset just past it
+        pool = cls(size)
+        pool.remaining, count = UNTRIED_HEADER.unpack_from(data, offset)
+        offset += UNTRIED_HEADER.size
+        swapped = array("I")
+        swapped.frombytes(bytes(data[offset:offset + 8 * count]))
+        for idx, cell in zip(swapped[::2], swapped[1::2]):
+            pool._at[idx] = cell
+            pool._where[cell] = idx
+        return pool, offset + 8 * count
+
+
+UNTRIED_HEADER = struct.Struct("<II")
@@ -0,0 +1,336 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from typing import Protocol, TYPE_CHECKING
+from collections.abc import Sequence
+from battleship.utils import generate_grid
+from battleship.boards import Board, BoardBackend, make_board
+from battleship.knowledge import KnowledgeMap, UntriedCells, SHOT
+from random import Random
+from enum import Enum
+
+if TYPE_CHECKING:
+    from battleship.eventlog import EventLog
+    from battleship.streams import RandomStreams
+
+class PlayerType(Enum):
+    HUMAN = 0
+    BOT = 1
+
+class TurnAction(Enum):
+    SHOOT = 0
+    MOVE = 1
+    SCAN = 2
+
+class Player(Protocol):
+    total_players: int
+    n: int
+    ship_sizes: Sequence[int]
+    rng: Random
+    player_type: PlayerType
+    player_grid: list[list[str]]
+    shot_coords: dict[int, list[tuple[int, int]]]
+    move_ship_chances: int | None
+    scan_chances: int | None
+    player_dead: bool
+        
+
+
+class HumanPlayer:
+    def __init__(self,
+        total_players: int = 2,
+        n: int = 6,
+        ship_sizes: Sequence[int] = (4, 3, 2, 2),
+        rng: Random | None = None,
+        player_type: PlayerType = PlayerType.HUMAN,
+        player_grid: list[list[str]] | None = None,
+        shot_coords: dict[int, list[tuple[int, int]]] | None = None,
+        move_ship_chances: int | None = None,
+        scan_chances: int | None = None,
+        player_dead: bool = True,
+        ):
+        self.total_players = total_players
+        self.n = n
+        self.ship_sizes = ship_sizes
+        self.rng = rng if rng is not None else Random()
+        self.player_type = player_type
+        self.player_grid = player_grid if player_grid is not None else generate_grid(self.n, self.ship_sizes, self.rng)
+        # a fresh dict per player, a shared default would collect every player's shots
+        self.shot_coords = shot_coords if shot_coords is not None else {}
+        for p in range(self.total_players):
+            self.shot_coords.update({p:[]})
+        self.move_ship_chances = move_ship_chances
+        self.scan_chances = scan_chances
+        self.player_dead = player_dead
+
+class BotPlayer:
+    def __init__(self,
+        total_players: int = 2,
+        n: int = 6,
+        ship_sizes: Sequence[int] = (4, 3, 2, 2),
+        rng: Random | None = None,
+        player_type: PlayerType = PlayerType.HUMAN,
+        player_grid: list[list[str]] | None = None,
+        shot_coords: dict[int, list[tuple[int, int]]] | None = None,
+        move_ship_chances: int | None = None,
+        scan_chances: int | None = None,
+        player_dead: bool = True,
+        ):
+        self.total_players = total_players
+        self.n = n
+        self.ship_sizes = ship_sizes
+        self.rng = rng if rng is not None else Random()
+        self.player_type = player_type
+        self.player_grid = player_grid if player_grid is not None else generate_grid(self.n, self.ship_sizes, self.rng)
+        # a fresh dict per player, a shared default would collect every player's shots
+        self.shot_coords = shot_coords if shot_coords is not None else {}
+        for p in range(self.total_players):
+            self.shot_coords.update({p:[]})
+        self.move_ship_chances = move_ship_chances
+        self.scan_chances = scan_chances
+        self.player_dead = player_dead
+
+
+
+class BattleshipModel:
+    def __init__(self,
+        n: int = 6,
+        k: int = 2,
+        ship_sizes: Sequence[int] = (4,3,2,2),
+        rng: Random | None = None,
+        turn: int = 0,
+        players: int = 2,
+        player_list: list[Player] | None = None,
+        max_powerup_uses: int = 3,
+        backend: BoardBackend = BoardBackend.LIST,
+        streams: RandomStreams | None = None):
+        # constant attributes
+        self.n = n
+        self.k = k
+        self.ship_sizes = ship_sizes
+        self.rng = rng if rng is not None else Random()
+        self.turn = turn
+        self.players = players
+        # MODIFIED COMBINED PLAYER GRIDS
+        self.player_list = player_list if player_list is not None else []
+        # max powerups
+        self.max_powerup_uses = max_powerup_uses
+        # board storage, see boards.py
+        self.backend = backend
+        self.boards: list[Board] = []
+        self.move_ship_chances: list[int] = []
+        self.scan_chances: list[int] = []
+        self.players_dead: list[bool] = []
+        # surviving ships per player and players with any ship left
+        self.ships_left: list[int] = []
+        self.live_players = 0
+        # ring of living players for turn order, and the living players as an indexed set
+        self.next_player: list[int] = []
+        self.prev_player: list[int] = []
+        self.live_list: list[int] = []
+        self.live_index: list[int] = []
+        self.knowledge = KnowledgeMap(n)
+        # cells each (shooter, target) pair has not tried yet, kept from the pair's first shot or scan
+        # part of the game state, saved with the model and in event-log snapshots
+        self.untried: dict[tuple[int, int], UntriedCells] = {}
+        # with streams every player's placement and play draw from their own stream, see streams.py
+        self.streams = streams
+        self.player_rngs: list[Random] = []
+        # turns played so far, and an optional recorder of every action, see eventlog.py
+        self.turn_count = 0
+        self.event_log: EventLog | None = None
+
+    def setup(self, players: int, streams: RandomStreams | None = None) -> None:
+        # (re)deal a fresh board and powerups for every player
+        self.players = players
+        self.turn = 0
+        self.turn_count = 0
+        if streams is not None:
+            self.streams = streams
+        if self.streams is not None:
+            self.boards = [make_board(generate_grid(self.n, self.ship_sizes, self.streams.random("placement", p)), self.backend) for p in range(players)]
+            self.player_rngs = [self.streams.random("play", p) for p in range(players)]
+        else:
+            self.boards = [make_board(generate_grid(self.n, self.ship_sizes, self.rng), self.backend) for _ in range(players)]
+            self.player_rngs = []
+        self.move_ship_chances = [self.max_powerup_uses] * players
+        self.scan_chances = [self.max_powerup_uses] * players
+        self.knowledge = KnowledgeMap(self.n)
+        self.untried = {}
+        self._index_players()
+
+    def _index_players(self) -> None:
+        # rebuild the per-player counters, ring and living set from the boards
+        players = self.players
+        self.ships_left = [board.alive_ships for board in self.boards]
+        self.players_dead = [left == 0 for left in self.ships_left]
+        self.live_players = self.players_dead.count(False)
+        self.live_list = [p for p in range(players) if not self.players_dead[p]]
+        self.live_index = [-1] * players
+        self.next_player = list(range(players))
+        self.prev_player = list(range(players))
+        for idx, p in enumerate(self.live_list):
+            self.live_index[p] = idx
+            self.next_player[p] = self.live_list[(idx + 1) % len(self.live_list)]
+            self.prev_player[p] = self.live_list[idx - 1]
+
+    def save(self, path: str) -> None:
+        # compact binary snapshot, see snapshot.py
+        from battleship.snapshot import save_model
+        save_model(self, path)
+
+    @classmethod
+    def load(cls, path: str, lazy: bool = True) -> BattleshipModel:
+        from battleship.snapshot import load_model
+        return load_model(path, lazy)
+
+    def is_game_over(self) -> bool:
+        return self.live_players <= 1
+
+
+    def grids(self) -> list[list[str]]:
+        # return grids
+        # ['A', '.', '.'] to "A . ."
+        res: list[list[str]] = []
+        for p in range(self.players):
+            res.append(self.boards[p].rows())
+        return res
+
+    def winner(self) -> int:
+        # Edge: if winner is called but game is not over
+        if not self.is_game_over():
+            raise AssertionError("Game is not yet over")
+
+        if self.live_players == 1:
+            return self.live_list[0]
+        # edge: all lost
+        return -1
+
+    def go_to_next_turn(self) -> None:
+        self.turn_count += 1
+
+        # if no one is alive, the turn stays where it is
+        # the ring only links living players, a dead current player still points past itself
+        if self.live_players > 0:
+            nxt = self.next_player[self.turn]
+            while self.players_dead[nxt]:
+                nxt = self.next_player[nxt]
+            self.turn = nxt
+
+        # snapshots hold the state at the start of the new turn, so they come after the turn moves on
+        if self.event_log is not None:
+            self.event_log.on_turn(self)
+
+    def _eliminate(self, p: int) -> None:
+        self.players_dead[p] = True
+        self.live_players -= 1
+
+        # unlink from the ring of living players
+        before, after = self.prev_player[p], self.next_player[p]
+        self.next_player[before] = after
+        self.prev_player[after] = before
+
+        # swap-remove from the living players set
+        idx = self.live_index[p]
+        last = self.live_list[-1]
+        self.live_list[idx] = last
+        self.live_index[last] = idx
+        self.live_list.pop()
+        self.live_index[p] = -1
+
+
+    def player_rng(self, player: int) -> Random:
+        # the player's own stream when the game was set up with streams, else the shared rng
+        return self.player_rngs[player] if self.player_rngs else self.rng
+
+    def get_random_ij(self) -> tuple[int, int]:
+        # return random (i, j) as the bot's moves
+        rng = self.player_rng(self.turn)
+        return (rng.randint(0, self.n - 1), rng.randint(0, self.n - 1))
+
+    def _untried_pool(self, shooter: int, target: int) -> UntriedCells:
+        pool = self.untried.get((shooter, target))
+        if pool is None:
+            pool = self.untried[(shooter, target)] = UntriedCells(self.n * self.n)
+            # only a model restored without its pools has cells revealed before the pool exists
+            board = self.boards[target]
+            for i, j in self.knowledge.revealed(shooter, target):
+                if self.knowledge.flags(shooter, target, i, j) & SHOT or not board.cell(i, j).isupper():
+                    pool.discard(i * self.n + j)
+        return pool
+
+    def get_untried_ij(self, target: int) -> tuple[int, int]:
+        # random (i, j) the current player has not shot or seen to be empty on target
+        pool = self._untried_pool(self.turn, target)
+        return divmod(pool.draw(self.player_rng(self.turn)), self.n)
+
+    def get_random_target(self) -> int:
+        # uniform over living players other than the current one
+        living = self.live_list
+        pos = self.live_index[self.turn]
+        rng = self.player_rng(self.turn)
+        if pos < 0:
+            return rng.choice(living)
+        if len(living) == 1:
+            return self.turn
+        r = rng.randrange(len(living) - 1)
+        return living[r + 1 if r >= pos else r]
+
+    def legal_moves(self, player: int | None = None) -> list[tuple[str, str]]:
+        # every (ship, direction) the player can move right now, defaults to the current player
+        return self.boards[self.turn if player is None else player].legal_moves()
+
+    def get_random_ship_move(self) -> tuple[str, str]:
+        moves = self.legal_moves()
+
+        # edge: all ships are dead or blocked
+        if not moves:
+            return ("", "")
+        return self.player_rng(self.turn).choice(moves)
+
+    def shoot(self, i: int, j: int, target: int | None = None) -> None:
+        # setup the target grid and saved shots for each player
+        if target is None:
+            target = 1 - self.turn # for edge cases
+
+        self._untried_pool(self.turn, target).discard(i * self.n + j)
+        self.knowledge.reveal(self.turn, target, i, j)
+        if self.event_log is not None:
+            self.event_log.record(self.turn_count, TurnAction.SHOOT, self.turn, target, i, j)
+
+        if self.boards[target].shoot(i, j):
+            self.ships_left[target] -= 1
+            if self.ships_left[target] == 0:
+                self._eliminate(target)
+
+    def scan(self, i: int, j:int, target:int) -> None:
+        if self.scan_chances[self.turn] > 0:
+            self.scan_chances[self.turn] -= 1
+            # scanned cells stay worth a shot only while they hold an afloat ship
+            pool = self._untried_pool(self.turn, target)
+            board = self.boards[target]
+            for r in range(max(i, 0), min(i + self.k, self.n)):
+                for c in range(max(j, 0), min(j + self.k, self.n)):
+                    if not board.cell(r, c).isupper():
+                        pool.discard(r * self.n + c)
+            self.knowledge.reveal_window(self.turn, target, i, j, self.k)
+            if self.event_log is not None:
+                self.event_log.record(self.turn_count, TurnAction.SCAN, self.turn, target, i, j)
+        
+    def move_ship(self, ship_movement_pair: tuple[str, str]) -> None:
+        target_ship, movement = ship_movement_pair
+        # an illegal move is a no-op that keeps the chance
+        if self.move_ship_chances[self.turn] > 0 and self.boards[self.turn].can_move(target_ship, movement):
+            self.move_ship_chances[self.turn] -= 1
+            self.boards[self.turn].move(target_ship, movement)
+            if self.event_log is not None:
+                self.event_log.record_move(self.turn_count, self.turn, target_ship, movement)
+
+    def get_random_action(self) -> str:
+        valid: list[str] = ["a"]
+        if self.move_ship_chances[self.turn] > 0:
+            valid.append("b")
+        if self.scan_chances[self.turn] > 0:
+            valid.append("c")
+        return self.player_rng(self.turn).choice(valid)
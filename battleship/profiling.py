@@ -0,0 +1,150 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from time import perf_counter_ns
+from typing import Any, TYPE_CHECKING
+import json
+
+if TYPE_CHECKING:
+    from battleship.model import BattleshipModel, PlayerType
+    from battleship.view import BattleshipView
+
+# bucket upper bounds in nanoseconds, 1us doubling up to about 8s
+BUCKETS = [1000 << b for b in range(24)]
+
+# (method, phase, action) timed on the model and on the view
+MODEL_PHASES = (
+    ("shoot", "action", "shoot"),
+    ("move_ship", "action", "move"),
+    ("scan", "action", "scan"),
+    ("grids", "grids", ""),
+    ("is_game_over", "game_over_check", ""),
+    ("go_to_next_turn", "next_turn", ""),
+    ("get_random_action", "bot_decision", ""),
+    ("get_random_target", "bot_decision", ""),
+    ("get_random_ij", "bot_decision", ""),
+    ("get_untried_ij", "bot_decision", ""),
+    ("get_random_ship_move", "bot_decision", ""),
+)
+VIEW_PHASES = (
+    ("show_grids", "render", ""),
+    ("show_final_grids", "render", ""),
+)
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total_ns = 0
+
+    def observe(self, ns: int) -> None:
+        self.counts[bisect_left(BUCKETS, ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+
+    def quantile(self, q: float) -> float:
+        # upper bound of the bucket holding the q-th observation, in seconds
+        rank = q * self.count
+        seen = 0
+        for b, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return (BUCKETS[b] if b < len(BUCKETS) else BUCKETS[-1] * 2) / 1e9
+        return 0.0
+
+
+class PhaseProfiler:
+    # times each phase of a game by wrapping the model and view methods on the instances
+    # nothing is wrapped until instrument(), so a game without a profiler pays nothing
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.histograms: dict[tuple[str, str, str], Histogram] = {}
+        self._wrapped: list[tuple[object, str]] = []
+        self._player_types: Sequence[PlayerType] = ()
+        self._model: BattleshipModel | None = None
+
+    def instrument(self, model: BattleshipModel, view: BattleshipView | None = None, player_types: Sequence[PlayerType] = ()) -> None:
+        self._model = model
+        self._player_types = player_types
+        for name, phase, action in MODEL_PHASES:
+            self._wrap(model, name, phase, action)
+        if view is not None:
+            for name, phase, action in VIEW_PHASES:
+                self._wrap(view, name, phase, action)
+
+    def _wrap(self, obj: object, name: str, phase: str, action: str) -> None:
+        original: Callable[..., Any] = getattr(obj, name)
+        observe = self.observe
+        model = self._model
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            # the phase belongs to whoever holds the turn when it starts
+            turn = model.turn if model is not None else -1
+            start = perf_counter_ns()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                observe(phase, action, perf_counter_ns() - start, turn)
+
+        setattr(obj, name, timed)
+        self._wrapped.append((obj, name))
+
+    def uninstrument(self) -> None:
+        for obj, name in self._wrapped:
+            delattr(obj, name)
+        self._wrapped.clear()
+
+    def observe(self, phase: str, action: str, ns: int, turn: int = -1) -> None:
+        player_type = self._player_types[turn].name.lower() if 0 <= turn < len(self._player_types) else ""
+        key = (phase, action, player_type)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(ns)
+
+    def report(self) -> dict[str, Any]:
+        phases: list[dict[str, Any]] = []
+        for (phase, action, player_type), histogram in sorted(self.histograms.items()):
+            phases.append({
+                "phase": phase,
+                "action": action,
+                "player_type": player_type,
+                "count": histogram.count,
+                "total_s": histogram.total_ns / 1e9,
+                "mean_s": histogram.total_ns / histogram.count / 1e9,
+                "p50_s": histogram.quantile(0.5),
+                "p99_s": histogram.quantile(0.99),
+                "buckets": {f"{bound / 1e9:g}": count for bound, count in zip(BUCKETS, histogram.counts) if count},
+            })
+        return {"phases": phases}
+
+    def prometheus(self) -> str:
+        name = "battleship_phase_seconds"
+        lines = [f"# HELP {name} Time spent in each phase of a battleship turn.", f"# TYPE {name} histogram"]
+        for (phase, action, player_type), histogram in sorted(self.histograms.items()):
+            labels = f'phase="{phase}",action="{action}",player_type="{player_type}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total_ns / 1e9}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        # .prom and .txt get the Prometheus text format, anything else JSON
+        with open(path, "w") as f:
+            if path.endswith((".prom", ".txt")):
+                f.write(self.prometheus())
+            else:
+                json.dump(self.report(), f, indent=2)
+
+    def finish(self) -> None:
+        self.uninstrument()
+        if self.path is not None:
+            self.write(self.path)
@@ -0,0 +1,61 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TextIO
+import re
+import sys
+
+from battleship.knowledge import KnowledgeMap
+
+WATER = "\033[34m"
+SHIP = "\033[33m"
+RESET = "\033[0m"
+
+# runs of hidden cells, water, or ship cells
+_RUNS = re.compile(r"\?+|\.+|[^.?]+")
+
+
+def _colour_run(match: re.Match[str]) -> str:
+    run = match.group()
+    if run[0] == "?":
+        return run
+    return f"{WATER if run[0] == '.' else SHIP}{run}{RESET}"
+
+
+class FrameRenderer:
+    # caches each row's encoded line and only re-encodes rows that changed, every frame still joins all of them
+    # frames are always written in full, the view prints prompts between them so there is no frame to patch in place
+    def __init__(self, out: TextIO | None = None):
+        self.out = out
+        self._keys: list[tuple[tuple[str, bytes | None], ...]] = []
+        self._lines: list[str] = []
+
+    def _encode(self, row: str, seen: bytes | None) -> str:
+        if seen is not None:
+            row = "".join(ch if s else "?" for ch, s in zip(row, seen))
+        return _RUNS.sub(_colour_run, row)
+
+    def frame(self, grids: Sequence[Sequence[str]], turn: int, knowledge: KnowledgeMap, n: int, reveal_all: bool = False) -> None:
+        # refresh the cached lines of rows that changed
+        if len(self._keys) != n:
+            self._keys = [()] * n
+            self._lines = [""] * n
+
+        for l in range(n):
+            key = tuple(
+                (grids[g][l], None if reveal_all or g == turn else bytes(knowledge.row(turn, g, l)))
+                for g in range(len(grids))
+            )
+            if key == self._keys[l]:
+                continue
+            self._keys[l] = key
+            self._lines[l] = "".join(self._encode(row, seen) + "  " for row, seen in key)
+
+    def _write(self, text: str) -> None:
+        (self.out or sys.stdout).write(text)
+
+    def draw(self, grids: Sequence[Sequence[str]], turn: int, knowledge: KnowledgeMap, n: int, reveal_all: bool = False) -> None:
+        self.frame(grids, turn, knowledge, n, reveal_all)
+        self._write("\n".join(self._lines) + "\n\n")
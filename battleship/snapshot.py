@@ -0,0 +1,211 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from array import array
+from random import Random
+from string import ascii_uppercase
+import mmap
+import os
+import struct
+
+from battleship.model import BattleshipModel
+from battleship.boards import BoardBackend, make_board
+from battleship.knowledge import KnowledgeMap, UntriedCells, pack_cells
+from battleship.streams import RandomStreams
+
+MAGIC = b"BSSV"
+VERSION = 3
+# magic, version, n, k, players, max powerup uses, backend, turn count, turn, ships
+HEADER = struct.Struct("<4sBHHHHBIHH")
+# gauss_next flag and value, then 624 state words and the position
+RNG_TAIL = struct.Struct("<Bd")
+RNG_WORDS = 625
+RNG_SIZE = 4 * RNG_WORDS + RNG_TAIL.size
+
+# layout after the header and ship sizes:
+#   move_ship_chances, scan_chances   players x uint16 each
+#   rng state                         625 x uint32, then RNG_TAIL
+#   streams                           uint8 flag and the 32 byte root key, then uint16 count and one rng state per player
+#   boards                            per ship: row, col, vertical, sunk bit-packed, padded to a byte per board
+#   knowledge                         uint32 count, then (observer, target) uint16 pair and 2 bits per cell
+#   untried cells                     uint32 count, then (shooter, target) uint16 pair and UntriedCells.pack
+
+
+def _coord_bits(n: int) -> int:
+    return max((n - 1).bit_length(), 1)
+
+
+def pack_board(rows: list[str], ship_count: int) -> bytes:
+    # boards are fully described by each ship's top-left cell, orientation and whether it sank
+    n = len(rows)
+    bits = _coord_bits(n)
+    found: dict[str, tuple[int, int, int, int]] = {}
+    for r, row in enumerate(rows):
+        for c, char in enumerate(row):
+            if char == ".":
+                continue
+            ship = char.upper()
+            if ship not in found:
+                found[ship] = (r, c, 0, int(char.islower()))
+            elif found[ship][0] != r:
+                top, left, _, sunk = found[ship]
+                found[ship] = (top, left, 1, sunk)
+
+    packed = 0
+    width = 2 * bits + 2
+    for idx in range(ship_count):
+        top, left, vertical, sunk = found[ascii_uppercase[idx]]
+        packed |= (top | left << bits | vertical << (2 * bits) | sunk << (2 * bits + 1)) << (idx * width)
+    return packed.to_bytes((ship_count * width + 7) // 8, "little")
+
+
+def unpack_board(data: bytes | memoryview, n: int, ship_sizes: tuple[int, ...]) -> list[list[str]]:
+    bits = _coord_bits(n)
+    width = 2 * bits + 2
+    coord_mask = (1 << bits) - 1
+    packed = int.from_bytes(data, "little")
+    grid = [["."] * n for _ in range(n)]
+    for idx, size in enumerate(ship_sizes):
+        ship = packed >> (idx * width)
+        top, left = ship & coord_mask, (ship >> bits) & coord_mask
+        vertical, sunk = (ship >> (2 * bits)) & 1, (ship >> (2 * bits + 1)) & 1
+        char = ascii_uppercase[idx].lower() if sunk else ascii_uppercase[idx]
+        for step in range(size):
+            if vertical:
+                grid[top + step][left] = char
+            else:
+                grid[top][left + step] = char
+    return grid
+
+
+def board_bytes(n: int, ship_count: int) -> int:
+    return (ship_count * (2 * _coord_bits(n) + 2) + 7) // 8
+
+
+def _pack_rng(rng: Random) -> bytes:
+    _, words, gauss_next = rng.getstate()
+    return array("I", words).tobytes() + RNG_TAIL.pack(gauss_next is not None, gauss_next or 0.0)
+
+
+def _unpack_rng(data: bytes | memoryview, offset: int) -> Random:
+    words = array("I")
+    words.frombytes(bytes(data[offset:offset + 4 * RNG_WORDS]))
+    has_gauss, gauss = RNG_TAIL.unpack_from(data, offset + 4 * RNG_WORDS)
+    rng = Random()
+    rng.setstate((3, tuple(words), gauss if has_gauss else None))
+    return rng
+
+
+def save_model(model: BattleshipModel, path: str) -> None:
+    n, players = model.n, model.players
+    ship_sizes = tuple(model.ship_sizes)
+    parts = [
+        HEADER.pack(MAGIC, VERSION, n, model.k, players, model.max_powerup_uses, model.backend.value, model.turn_count, model.turn, len(ship_sizes)),
+        array("H", ship_sizes).tobytes(),
+        array("H", model.move_ship_chances).tobytes(),
+        array("H", model.scan_chances).tobytes(),
+    ]
+
+    parts.append(_pack_rng(model.rng))
+    streams = model.streams
+    parts.append(struct.pack("<B", streams is not None) + (streams.key if streams is not None else bytes(32)))
+    parts.append(struct.pack("<H", len(model.player_rngs)))
+    parts.extend(_pack_rng(rng) for rng in model.player_rngs)
+
+    for board in model.boards:
+        parts.append(pack_board(board.rows(), len(ship_sizes)))
+
+    # maps that were loaded but never touched are copied through still packed
+    knowledge = model.knowledge
+    pairs = [(pair, pack_cells(cells)) for pair, cells in knowledge.maps.items()]
+    pairs += [(pair, bytes(data)) for pair, data in knowledge.packed.items()]
+    parts.append(struct.pack("<I", len(pairs)))
+    for (observer, target), data in sorted(pairs):
+        parts.append(struct.pack("<HH", observer, target))
+        parts.append(data)
+
+    parts.append(struct.pack("<I", len(model.untried)))
+    for (shooter, target), pool in sorted(model.untried.items()):
+        parts.append(struct.pack("<HH", shooter, target))
+        parts.append(pool.pack())
+
+    # the model may still read knowledge from a lazy load of this very file, and other lazy loads
+    # may map it too, so the new save goes to a fresh file that replaces the old one
+    knowledge.release()
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"".join(parts))
+    os.replace(tmp, path)
+
+
+def load_model(path: str, lazy: bool = True) -> BattleshipModel:
+    # with lazy set the file is memory-mapped and knowledge maps are only unpacked when read
+    mapped = None
+    with open(path, "rb") as f:
+        if lazy:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data: bytes | memoryview = memoryview(mapped) if mapped is not None else f.read()
+
+    magic, version, n, k, players, max_powerup_uses, backend, turn_count, turn, ships = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} battleship save")
+    offset = HEADER.size
+
+    def read_u16(count: int) -> list[int]:
+        nonlocal offset
+        values = array("H")
+        values.frombytes(bytes(data[offset:offset + 2 * count]))
+        offset += 2 * count
+        return values.tolist()
+
+    ship_sizes = tuple(read_u16(ships))
+    move_ship_chances = read_u16(players)
+    scan_chances = read_u16(players)
+
+    rng = _unpack_rng(data, offset)
+    offset += RNG_SIZE
+    streams = None
+    if data[offset]:
+        streams = RandomStreams.__new__(RandomStreams)
+        streams.key = bytes(data[offset + 1:offset + 33])
+    (player_rngs,) = struct.unpack_from("<H", data, offset + 33)
+    offset += 35
+
+    model = BattleshipModel(n=n, k=k, ship_sizes=ship_sizes, rng=rng, turn=turn, players=players, max_powerup_uses=max_powerup_uses, backend=BoardBackend(backend), streams=streams)
+    for _ in range(player_rngs):
+        model.player_rngs.append(_unpack_rng(data, offset))
+        offset += RNG_SIZE
+    model.turn_count = turn_count
+    model.move_ship_chances = move_ship_chances
+    model.scan_chances = scan_chances
+
+    size = board_bytes(n, ships)
+    for _ in range(players):
+        model.boards.append(make_board(unpack_board(data[offset:offset + size], n, ship_sizes), model.backend))
+        offset += size
+    model._index_players()  # pyright: ignore[reportPrivateUsage]
+
+    knowledge = model.knowledge = KnowledgeMap(n)
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    size = (n * n + 3) // 4
+    for _ in range(count):
+        observer, target = struct.unpack_from("<HH", data, offset)
+        knowledge.packed[(observer, target)] = data[offset + 4:offset + 4 + size]
+        offset += 4 + size
+
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    for _ in range(count):
+        shooter, target = struct.unpack_from("<HH", data, offset)
+        model.untried[(shooter, target)], offset = UntriedCells.unpack(n * n, data, offset + 4)
+    if lazy:
+        knowledge.mapped = mapped
+        if not knowledge.packed and isinstance(data, memoryview):
+            # no maps to read later, so nothing needs the mapped file
+            data.release()
+            knowledge.release()
+    else:
+        knowledge.all_maps()
+    return model
@@ -0,0 +1,34 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from random import Random
+
+
+def _derive(key: bytes, part: int | str) -> bytes:
+    # ints and strs are tagged so that 1 and "1" name different streams
+    tag = b"i" if isinstance(part, int) else b"s"
+    return blake2b(tag + str(part).encode(), key=key, digest_size=32).digest()
+
+
+class RandomStreams:
+    # a tree of independent Random streams under one root seed, named by paths such as (game, "placement", player)
+    # a stream depends only on the root seed and its own path, never on how many numbers other streams drew,
+    # so any game, seat or purpose can be reproduced alone on any worker
+    def __init__(self, seed: int | str, *path: int | str):
+        key = _derive(b"battleship", seed)
+        for part in path:
+            key = _derive(key, part)
+        self.key = key
+
+    def split(self, *path: int | str) -> RandomStreams:
+        child = RandomStreams.__new__(RandomStreams)
+        key = self.key
+        for part in path:
+            key = _derive(key, part)
+        child.key = key
+        return child
+
+    def random(self, *path: int | str) -> Random:
+        return Random(int.from_bytes(self.split(*path).key, "little"))
@@ -0,0 +1,372 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Iterable, MutableSequence, Sequence
+from bisect import bisect_right
+from random import Random
+import struct
+from string import ascii_uppercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+
+class _Fenwick:
+    # prefix sums over per-line placement counts, O(log n) update and search
+    def __init__(self, weights: Sequence[int]):
+        self.size = len(weights)
+        self.tree = [0] * (self.size + 1)
+        for idx, w in enumerate(weights, 1):
+            self.tree[idx] += w
+            parent = idx + (idx & -idx)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[idx]
+        self.sum = sum(weights)
+
+    def add(self, idx: int, delta: int) -> None:
+        self.sum += delta
+        idx += 1
+        while idx <= self.size:
+            self.tree[idx] += delta
+            idx += idx & -idx
+
+    def find(self, k: int) -> tuple[int, int]:
+        # line holding the k-th placement, and k's offset inside that line
+        pos = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= k:
+                pos = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return pos, k
+
+
+class PlacementIndex:
+    # free runs [start, end) per row (for "H" ships) and per column (for "V" ships)
+    def __init__(self, n: int, ship_sizes: Sequence[int]):
+        self.n = n
+        self.sizes = sorted(set(ship_sizes))
+        self.runs: dict[str, list[list[tuple[int, int]]]] = {
+            orie: [[(0, n)] for _ in range(n)] for orie in "HV"
+        }
+        self.trees: dict[tuple[str, int], _Fenwick] = {
+            (orie, size): _Fenwick([max(0, n - size + 1)] * n) for orie in "HV" for size in self.sizes
+        }
+
+    def count(self, orie: str, size: int) -> int:
+        return self.trees[(orie, size)].sum
+
+    def draw(self, orie: str, size: int, rng: Random) -> tuple[int, int]:
+        line, rem = self.trees[(orie, size)].find(rng.randrange(self.count(orie, size)))
+        start = 0
+        for a, b in self.runs[orie][line]:
+            fits = b - a - size + 1
+            if fits > 0:
+                if rem < fits:
+                    start = a + rem
+                    break
+                rem -= fits
+        return (line, start) if orie == "H" else (start, line)
+
+    def _cut(self, orie: str, line: int, lo: int, hi: int) -> None:
+        runs = self.runs[orie][line]
+        idx = bisect_right(runs, (lo, self.n + 1)) - 1
+        if idx < 0 or runs[idx][1] < hi:
+            # already (partly) taken
+            return
+        a, b = runs[idx]
+        runs[idx:idx + 1] = [run for run in ((a, lo), (hi, b)) if run[0] < run[1]]
+        for size in self.sizes:
+            delta = max(0, lo - a - size + 1) + max(0, b - hi - size + 1) - max(0, b - a - size + 1)
+            if delta:
+                self.trees[(orie, size)].add(line, delta)
+
+    def place(self, i: int, j: int, orie: str, size: int) -> None:
+        if orie == "H":
+            self._cut("H", i, j, j + size)
+            for c in range(j, j + size):
+                self._cut("V", c, i, i + 1)
+        else:
+            self._cut("V", j, i, i + size)
+            for r in range(i, i + size):
+                self._cut("H", r, j, j + 1)
+
+
+    def block(self, i: int, j: int) -> None:
+        # a cell no ship may use, e.g. one known to be water
+        self._cut("H", i, j, j + 1)
+        self._cut("V", j, i, i + 1)
+
+
+class LayoutSampler:
+    # draws layouts avoiding blocked cells, reusing one occupancy buffer between samples
+    def __init__(self, n: int, ship_sizes: Sequence[int], blocked: Iterable[tuple[int, int]] = ()):
+        self.n = n
+        self.ship_sizes = list(ship_sizes)
+        self.index = PlacementIndex(n, ship_sizes)
+        for i, j in blocked:
+            self.index.block(i, j)
+        self.occupied = bytearray(n * n)
+        self._placed: list[int] = []
+
+    def _place(self, ship_size: int, rng: Random, tries: int) -> bool:
+        n, index, occupied = self.n, self.index, self.occupied
+        for _ in range(tries):
+            orie = rng.choice("VH")
+            if not index.count(orie, ship_size):
+                orie = "H" if orie == "V" else "V"
+            if not index.count(orie, ship_size):
+                return False
+            # the index only knows the blocked cells, overlaps within this layout are rejected
+            i, j = index.draw(orie, ship_size, rng)
+            step = 1 if orie == "H" else n
+            cells = range(i * n + j, i * n + j + step * ship_size, step)
+            if not any(occupied[c] for c in cells):
+                for c in cells:
+                    occupied[c] = 1
+                self._placed.extend(cells)
+                return True
+        return False
+
+    def sample(self, rng: Random, counts: MutableSequence[int], tries: int = 32) -> bool:
+        # adds one to counts[i * n + j] for every ship cell of a successful layout
+        ok = all(self._place(ship_size, rng, tries) for ship_size in self.ship_sizes)
+        if ok:
+            for c in self._placed:
+                counts[c] += 1
+        for c in self._placed:
+            self.occupied[c] = 0
+        self._placed.clear()
+        return ok
+
+
+def _placement_masks(n: int, size: int, orie: str) -> list[int]:
+    # every placement on an empty board, bit r * n + c set for each covered cell
+    # placement idx starts at divmod(idx, width) with width n - size + 1 for "H" and n for "V"
+    if size > n:
+        return []
+    if orie == "H":
+        ship = (1 << size) - 1
+        return [ship << (r * n + c) for r in range(n) for c in range(n - size + 1)]
+    ship = sum(1 << (k * n) for k in range(size))
+    return [ship << (r * n + c) for r in range(n - size + 1) for c in range(n)]
+
+
+class PlacementTables:
+    # precomputed placement masks per (n, ship size, orientation), least recently used dropped past max_tables
+    MAGIC = b"BSPT"
+    HEADER = struct.Struct("<4sBI")
+    TABLE = struct.Struct("<HHcI")
+
+    def __init__(self, max_tables: int = 64):
+        self.max_tables = max_tables
+        self.tables: OrderedDict[tuple[int, int, str], list[int]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, n: int, size: int, orie: str) -> list[int]:
+        key = (n, size, orie)
+        table = self.tables.get(key)
+        if table is not None:
+            self.tables.move_to_end(key)
+            self.hits += 1
+            return table
+        self.misses += 1
+        return self._store(key, _placement_masks(n, size, orie))
+
+    def _store(self, key: tuple[int, int, str], table: list[int]) -> list[int]:
+        self.tables[key] = table
+        self.tables.move_to_end(key)
+        while len(self.tables) > self.max_tables:
+            self.tables.popitem(last=False)
+        return table
+
+    def save(self, path: str) -> None:
+        parts = [self.HEADER.pack(self.MAGIC, 1, len(self.tables))]
+        for (n, size, orie), table in self.tables.items():
+            width = (n * n + 7) // 8
+            parts.append(self.TABLE.pack(n, size, orie.encode(), len(table)))
+            parts.extend(mask.to_bytes(width, "little") for mask in table)
+        with open(path, "wb") as f:
+            f.write(b"".join(parts))
+
+    def load(self, path: str) -> None:
+        # adds the saved tables as the most recently used ones
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, count = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != 1:
+            raise ValueError(f"{path} is not a placement table file")
+        offset = self.HEADER.size
+        for _ in range(count):
+            n, size, orie, masks = self.TABLE.unpack_from(data, offset)
+            offset += self.TABLE.size
+            width = (n * n + 7) // 8
+            table = [int.from_bytes(data[start:start + width], "little") for start in range(offset, offset + masks * width, width)]
+            offset += masks * width
+            self._store((n, size, orie.decode()), table)
+
+
+# boards up to this size are generated from placement tables, a table holds about 2 n^2 masks of n^2 bits
+MAX_TABLE_N = 32
+PLACEMENT_TABLES = PlacementTables()
+
+
+def _draw_placement(table: list[int], occupied: int, rng: Random, tries: int = 16) -> int:
+    # uniform over the placements clear of occupied, -1 if there are none
+    if not table:
+        return -1
+    for _ in range(tries):
+        idx = rng.randrange(len(table))
+        if not table[idx] & occupied:
+            return idx
+    # dense board: list the legal placements once
+    legal = [idx for idx, mask in enumerate(table) if not mask & occupied]
+    return rng.choice(legal) if legal else -1
+
+
+def _generate_from_tables(n: int, ship_sizes: Sequence[int], rng: Random, tables: PlacementTables) -> list[list[str]]:
+    grid = [["."] * n for _ in range(n)]
+    occupied = 0
+
+    for ship_index, ship_size in enumerate(ship_sizes):
+        orie = rng.choice("VH")
+        table = tables.get(n, ship_size, orie)
+        idx = _draw_placement(table, occupied, rng)
+        # dense board: fall back to the other orientation before giving up
+        if idx < 0:
+            orie = "H" if orie == "V" else "V"
+            table = tables.get(n, ship_size, orie)
+            idx = _draw_placement(table, occupied, rng)
+        if idx < 0:
+            raise ValueError(f"No room left for a ship of size {ship_size} on a {n}x{n} grid")
+
+        occupied |= table[idx]
+        i, j = divmod(idx, n - ship_size + 1 if orie == "H" else n)
+        for k in range(ship_size):
+            _i = i + (k if orie == "V" else 0)
+            _j = j + (k if orie == "H" else 0)
+            grid[_i][_j] = ascii_uppercase[ship_index]
+
+    return grid
+
+
+def generate_grid(n: int, ship_sizes: Sequence[int], rng: Random, tables: PlacementTables | None = None) -> list[list[str]]:
+    # small boards reuse cached placement tables, larger ones search a PlacementIndex
+    if n <= MAX_TABLE_N:
+        return _generate_from_tables(n, ship_sizes, rng, tables if tables is not None else PLACEMENT_TABLES)
+
+    grid = [["."] * n for _ in range(n)]
+    index = PlacementIndex(n, ship_sizes)
+
+    for ship_index, ship_size in enumerate(ship_sizes):
+        orie = rng.choice("VH")
+        # dense board: fall back to the other orientation before giving up
+        if not index.count(orie, ship_size):
+            orie = "H" if orie == "V" else "V"
+        if not index.count(orie, ship_size):
+            raise ValueError(f"No room left for a ship of size {ship_size} on a {n}x{n} grid")
+
+        i, j = index.draw(orie, ship_size, rng)
+        index.place(i, j, orie, ship_size)
+
+        for k in range(ship_size):
+            _i = i + (k if orie == "V" else 0)
+            _j = j + (k if orie == "H" else 0)
+            grid[_i][_j] = ascii_uppercase[ship_index]
+
+    return grid
+
+def generate_grids_batch(count: int, n: int, ship_sizes: Sequence[int], seed: int | None = None) -> NDArray[np.uint8]:
+    # (count, n, n) boards, 0 is water and ship_index + 1 marks ascii_uppercase[ship_index]
+    import numpy as np
+
+    if any(size > n for size in ship_sizes):
+        raise ValueError(f"A ship of size {max(ship_sizes)} does not fit on a {n}x{n} grid")
+
+    rng = np.random.default_rng(seed)
+    grids = np.zeros((count, n, n), dtype=np.uint8)
+
+    for ship_index, ship_size in enumerate(ship_sizes):
+        ship_id = ship_index + 1
+        offsets = np.arange(ship_size)
+        vertical = rng.random(count) < 0.5
+        pending = np.arange(count)
+
+        # rejection sampling is exact and cheap while boards are sparse
+        for _ in range(8):
+            vert = vertical[pending]
+            i = rng.integers(0, np.where(vert, n - ship_size + 1, n))
+            j = rng.integers(0, np.where(vert, n, n - ship_size + 1))
+            ci = i[:, None] + vert[:, None] * offsets
+            cj = j[:, None] + ~vert[:, None] * offsets
+            free = (grids[pending[:, None], ci, cj] == 0).all(axis=1)
+            grids[pending[free, None], ci[free], cj[free]] = ship_id
+            pending = pending[~free]
+            if not len(pending):
+                break
+
+        if len(pending):
+            _place_exact(grids, pending, vertical[pending], ship_id, ship_size, rng)
+
+    return grids
+
+
+def _place_exact(grids: NDArray[np.uint8], boards: NDArray[np.intp], vertical: NDArray[np.bool_], ship_id: int, ship_size: int, rng: np.random.Generator) -> None:
+    # dense boards: list every legal start with a sliding window and draw one uniformly
+    import numpy as np
+
+    occupied = grids[boards] != 0
+    m, n = len(boards), grids.shape[1]
+    cs = np.zeros((m, n + 1, n + 1), dtype=np.int32)
+    cs[:, 1:, 1:] = occupied.cumsum(axis=1).cumsum(axis=2)
+    # ship covers rows i..i+h-1 and cols j..j+w-1
+    legal: dict[bool, NDArray[np.bool_]] = {}
+    for vert, (h, w) in ((True, (ship_size, 1)), (False, (1, ship_size))):
+        window = cs[:, h:, w:] - cs[:, :-h, w:] - cs[:, h:, :-w] + cs[:, :-h, :-w]
+        legal[vert] = (window == 0).reshape(m, -1)
+
+    counts_v = legal[True].sum(axis=1)
+    counts_h = legal[False].sum(axis=1)
+    if ((counts_v == 0) & (counts_h == 0)).any():
+        raise ValueError(f"No room left for a ship of size {ship_size} on a {n}x{n} grid")
+    # keep the drawn orientation unless only the other one still fits
+    placed_vertical: NDArray[np.bool_] = np.asarray(np.where(vertical, counts_v > 0, counts_h == 0), dtype=np.bool_)
+
+    for vert in (True, False):
+        rows = np.flatnonzero(placed_vertical == vert)
+        if not len(rows):
+            continue
+        mask = legal[vert][rows]
+        k = (rng.random(len(rows)) * mask.sum(axis=1)).astype(np.int64)
+        pick = (mask.cumsum(axis=1) > k[:, None]).argmax(axis=1)
+        width = n - (0 if vert else ship_size - 1)
+        i, j = pick // width, pick % width
+        offsets = np.arange(ship_size)
+        ci = i[:, None] + (offsets if vert else 0 * offsets)
+        cj = j[:, None] + (0 * offsets if vert else offsets)
+        grids[boards[rows, None], ci, cj] = ship_id
+
+#
+'''
+1. who to scan
+2. give i, j
+
+def scan(self, i: int, j:int, target:int) -> None:
+        # setup the target grid and saved shots for each player
+        target_grid_dic: dict[int, Sequence[Sequence[int]]] = {0:self.grid_0, 1:self.grid_1, 2:self.grid_2}
+        player_saved_shots_dic: dict[int, Sequence[Sequence[int]]] = {0:self.player0_shots, 1:self.player1_shots, 2:self.player2_shots}
+        target_grid: Sequence[Sequence[int]] = target_grid_dic[target]
+
+        for r in range(len(target_grid)):
+            for c in range(len(target_grid[0])):
+                if i <= r <= i + k - 1 and j <= c <= j + k - 1:
+                    player_saved_shots_dic[self.turn].append((i, j))
+
+'''
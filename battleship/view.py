@@ -0,0 +1,221 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from typing import TextIO
+from collections.abc import Sequence
+from battleship.model import PlayerType
+from battleship.knowledge import KnowledgeMap
+from battleship.render import FrameRenderer
+import os
+
+_terminal_ready = False
+
+
+def setup_terminal() -> None:
+    # windows consoles only honour ANSI colours after a shell has run once, elsewhere this spawns nothing
+    global _terminal_ready
+    if not _terminal_ready and os.name == "nt":
+        os.system("")
+    _terminal_ready = True
+
+class BattleshipView:
+    def __init__(self, out: TextIO | None = None):
+        setup_terminal()
+        self._renderer = FrameRenderer(out)
+
+    def ask_what_action(self, player_type: PlayerType, turn: int ) -> str:
+        ans = ""
+        while ans not in ["a", "b", "c"]:
+            try:
+                ans = str(input("▶️ Pick action (Shoot [a] | Move [b] | Scan [c]): ")).lower()
+                if ans not in ['a', 'b', 'c']:
+                    print('Input a valid action')
+            except KeyboardInterrupt:
+                exit()
+            except ValueError:
+                print("Input a valid action")
+        print()
+        options_dic: dict[str, str] = {'a':'shoot a ship', 'b':'move a ship', 'c':'scan a grid'}
+        print(f"Player {turn} chose to {options_dic[ans]}")
+        return ans
+
+
+
+    def ask_what_to_move(self, player_type: PlayerType, turn: int, legal_moves: Sequence[tuple[str, str]]) -> tuple[str, str]:
+        # legal_moves comes from BattleshipModel.legal_moves
+        present_ships: list[str] = sorted({ship for ship, _ in legal_moves})
+
+        # edge: no ship can move
+        if not legal_moves:
+            print("None of your ships can move")
+            return ("", "")
+
+        # ask valid input
+        target_ship: str = ""
+        movement: str = ""
+        while (target_ship, movement) not in legal_moves:
+            try:
+                target_ship = str(input(f"▶️ Which functioning ship do u want to move: ")).upper()
+                movement = str(input(f"▶️ How to move [u/d for vertical ships][l/r for horizontal ships]: ")).lower()
+                if target_ship not in present_ships:
+                    print(f"Please input one of your valid ships [{present_ships}]")
+                elif (target_ship, movement) not in legal_moves:
+                    print(f"Please input a valid move {[move for ship, move in legal_moves if ship == target_ship]}")
+            except KeyboardInterrupt:
+                exit()
+            except ValueError:
+                print(f"Please input one of your valid ships [{present_ships}]")
+        return (target_ship, movement)
+
+
+    def show_grids(self, grids: Sequence[Sequence[str]], turn: int, knowledge: KnowledgeMap, n: int) -> None:
+        self._renderer.draw(grids, turn, knowledge, n)
+
+    def show_final_grids(self, grids: Sequence[Sequence[str]], turn: int, knowledge: KnowledgeMap, n: int) -> None:
+        self._renderer.draw(grids, turn, knowledge, n, reveal_all=True)
+
+
+    def ask_for_location(self, n: int) -> tuple[int, int]:
+        i, j = -1, -1
+
+        while not 0 <= i < n:
+            try:
+                i = int(input(f"▶️ Choose a row    [0-{n-1}]: "))
+            except KeyboardInterrupt:
+                exit()
+            except Exception:
+                ...
+
+        while not 0 <= j < n:
+            try:
+                j = int(input(f"▶️ Choose a column [0-{n-1}]: "))
+            except KeyboardInterrupt:
+                exit()
+            except Exception:
+                ...
+
+        print()
+        return i, j
+
+    def ask_for_top_left_scan_point(self, n: int) -> tuple[int, int]:
+        i, j = -1, -1
+
+        while not 0 <= i < n:
+            try:
+                i = int(input(f"▶️ Choose a row of top-leftmost cell to scan [0-{n-1}]: "))
+            except KeyboardInterrupt:
+                exit()
+            except Exception:
+                ...
+
+        while not 0 <= j < n:
+            try:
+                j = int(input(f"▶️ Choose a column of top-leftmost cell to scan [0-{n-1}]: "))
+            except KeyboardInterrupt:
+                exit()
+            except Exception:
+                ...
+
+        print()
+        return i, j
+
+    def ask_num_players(self) -> int:
+        player_count = -1
+        while not 2 <= player_count <= 3:
+            try:
+                player_count = int(input(f"▶️ How many players will be playing this match [2-3 players]: "))
+                
+            except KeyboardInterrupt:
+                exit()
+            except Exception:
+                ...
+        print()
+        return player_count
+
+    def ask_who_to_shoot(self, players: int, turn: int) -> int:
+        target = -1
+        
+        while target not in (0, 1, 2) or turn == target:
+            try:
+                print(f'You are player {turn}')
+                target = int(input(f"▶️ What Player No. should you shoot [0 / 1 / 2]: "))
+                if target == turn:
+                    print("You can't damage yourself!! (Chill!)")
+                if target not in (0, 1, 2):
+                    print("Please enter a valid player number.")
+            except KeyboardInterrupt:
+                exit()
+            except ValueError:
+                print("Please enter a valid player number.")
+        print()
+        return target
+
+    def ask_who_to_scan(self, players: int, turn: int) -> int:
+        target = -1
+        
+        while target not in (0, 1, 2) or turn == target:
+            try:
+                print(f'You are player {turn}')
+                target = int(input(f"▶️ What Player No. should you scan [0 / 1 / 2]: "))
+                if target == turn:
+                    print("You can't scan yourself!! (Chill!)")
+                if target not in (0, 1, 2):
+                    print("Please enter a valid player number.")
+            except KeyboardInterrupt:
+                exit()
+            except ValueError:
+                print("Please enter a valid player number.")
+        print()
+        return target
+
+    def is_human_or_bot(self, player_num: int) -> PlayerType:
+        player_type: str = 'ee'
+        while not player_type in {'h', 'b'}:
+            try:
+                player_type = str(input(f"▶️ Is Player {player_num} a Human or a Bot [h / b]: ")).lower()
+            except KeyboardInterrupt:
+                exit()
+            except Exception:
+                ...
+        print()
+        return PlayerType.HUMAN if player_type == 'h' else PlayerType.BOT
+
+    def whos_turn_is_it(self, turn: int, move_ship_chances: Sequence[int], scan_chances:Sequence[int]) -> None:
+        print(f"It's Player {turn}'s turn. {move_ship_chances[turn]} move ship chances left & {scan_chances[turn]} scan chances left.")
+        print()
+
+    def show_shot(self, i: int, j: int, turn: int) -> None:
+        print(f"({i},{j}) was shot by Player {turn}!")
+        print()
+
+    def show_end_message(self, winner: int) -> None:
+        if winner == -1:
+            print("It's a draw! No one wins.")
+        elif winner == 0:
+            print("You win!")
+        else:
+            print(f"Player {winner} wins!")
+        print()
+
+    def ask_n_size(self) -> int:
+        n: int = -1
+        while n < 1:
+            try:
+                n = int(input(f"▶️ Set n size of the grids' sides: "))
+            except KeyboardInterrupt:
+                exit()
+            except ValueError:
+                print("Please input a valid value")
+        return n
+
+    def ask_k_size(self) -> int:
+        k: int = -1
+        while k < 1:
+            try:
+                k = int(input(f"▶️ Set k size of the scan area (k x k sides wide): "))
+            except KeyboardInterrupt:
+                exit()
+            except ValueError:
+                print("Please input a valid value")
+        return k
@@ -0,0 +1,275 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from random import Random
+from typing import Any, TextIO
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from battleship.boards import BoardBackend
+from battleship.model import BattleshipModel
+from battleship.utils import generate_grid
+from battleship.view import BattleshipView
+from bots import RandomBot
+from simulate import play_game
+
+FLEETS: dict[str, tuple[int, ...]] = {
+    "classic": (4, 3, 2, 2),
+    "full": (5, 4, 4, 3, 3, 3, 2, 2, 2, 2),
+}
+# headless games with random bots need ~n^2 log n turns, so only small boards
+MAX_GAME_N = 64
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+# cumulative import time a fresh worker may spend on each module, in milliseconds
+IMPORT_BUDGETS_MS: dict[str, float] = {
+    "battleship": 5.0,
+    # measured at 38-46ms, most of it typing, re and enum, which every worker pays for anyway
+    "battleship.model": 60.0,
+}
+
+
+def _time_op(op: Callable[[], object], min_time: float) -> tuple[int, float]:
+    # run op in growing batches until min_time has passed
+    calls, elapsed, batch = 0, 0.0, 1
+    while elapsed < min_time:
+        start = time.perf_counter()
+        for _ in range(batch):
+            op()
+        elapsed += time.perf_counter() - start
+        calls += batch
+        batch *= 2
+    return calls, elapsed
+
+
+def _peak_kib(op: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        op()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _model(n: int, players: int, fleet: Sequence[int], backend: BoardBackend, seed: int = 0) -> BattleshipModel:
+    model = BattleshipModel(n=n, k=max(1, n // 8), ship_sizes=fleet, rng=Random(seed), backend=backend)
+    model.setup(players)
+    # unlimited powerups so scan and move_ship keep doing work
+    model.move_ship_chances = [1 << 30] * players
+    model.scan_chances = [1 << 30] * players
+    return model
+
+
+def _finished_model(n: int, players: int, fleet: Sequence[int], backend: BoardBackend) -> BattleshipModel:
+    model = _model(n, players, fleet, backend)
+    for p in range(1, players):
+        for i, row in enumerate(model.boards[p].rows()):
+            for j, char in enumerate(row):
+                if char.isupper():
+                    model.shoot(i, j, p)
+    return model
+
+
+def _cases(n: int, players: int, fleet: Sequence[int], backend: BoardBackend, devnull: TextIO) -> dict[str, Callable[[], Callable[[], object]]]:
+    # name -> setup returning the operation to time, views draw into devnull
+    rng = Random(1)
+
+    def shoot() -> Callable[[], object]:
+        model = _model(n, players, fleet, backend)
+        return lambda: model.shoot(rng.randrange(n), rng.randrange(n), 1)
+
+    def scan() -> Callable[[], object]:
+        model = _model(n, players, fleet, backend)
+        return lambda: model.scan(rng.randrange(n), rng.randrange(n), 1)
+
+    def move_ship() -> Callable[[], object]:
+        model = _model(n, players, fleet, backend)
+        board = model.boards[0]
+        moves = [(ship, m) for ship in board.ships() for m in "udlr" if board.can_move(ship, m)]
+        if not moves:
+            return lambda: None
+        ship, move = moves[0]
+        back = {"u": "d", "d": "u", "l": "r", "r": "l"}
+        state = [move]
+
+        def op() -> None:
+            model.move_ship((ship, state[0]))
+            state[0] = back[state[0]]
+        return op
+
+    def is_game_over() -> Callable[[], object]:
+        model = _model(n, players, fleet, backend)
+        return model.is_game_over
+
+    def winner() -> Callable[[], object]:
+        return _finished_model(n, players, fleet, backend).winner
+
+    def go_to_next_turn() -> Callable[[], object]:
+        return _model(n, players, fleet, backend).go_to_next_turn
+
+    def grids() -> Callable[[], object]:
+        return _model(n, players, fleet, backend).grids
+
+    def show_grids() -> Callable[[], object]:
+        # a fresh view per call, so every row is encoded
+        model = _model(n, players, fleet, backend)
+        rendered = model.grids()
+        return lambda: BattleshipView(devnull).show_grids(rendered, 0, model.knowledge, n)
+
+    def show_grids_cached() -> Callable[[], object]:
+        model = _model(n, players, fleet, backend)
+        rendered = model.grids()
+        view = BattleshipView(devnull)
+        return lambda: view.show_grids(rendered, 0, model.knowledge, n)
+
+    def full_game() -> Callable[[], object]:
+        seeds = iter(range(1 << 30))
+
+        def op() -> None:
+            model = _model(n, players, fleet, backend, next(seeds))
+            model.move_ship_chances = [model.max_powerup_uses] * players
+            model.scan_chances = [model.max_powerup_uses] * players
+            play_game(model, [RandomBot(p) for p in range(players)])
+        return op
+
+    cases: dict[str, Callable[[], Callable[[], object]]] = {
+        "model.shoot": shoot,
+        "model.scan": scan,
+        "model.move_ship": move_ship,
+        "model.is_game_over": is_game_over,
+        "model.winner": winner,
+        "model.go_to_next_turn": go_to_next_turn,
+        "model.grids": grids,
+        "view.show_grids": show_grids,
+        "view.show_grids_cached": show_grids_cached,
+    }
+    if n <= MAX_GAME_N:
+        cases["headless_game"] = full_game
+    return cases
+
+
+def run(sizes: Sequence[int], player_counts: Sequence[int], fleets: Sequence[str], backends: Sequence[BoardBackend], min_time: float, only: str | None = None) -> list[dict[str, object]]:
+    results: list[dict[str, object]] = []
+
+    def record(name: str, params: dict[str, object], setup: Callable[[], Callable[[], object]]) -> None:
+        if only and only not in name:
+            return
+        op = setup()
+        calls, elapsed = _time_op(op, min_time)
+        results.append({
+            "name": name,
+            **params,
+            "ops_per_sec": calls / elapsed,
+            "peak_kib": _peak_kib(op),
+            "setup_peak_kib": _peak_kib(setup),
+        })
+        print(f"{name:28} {json.dumps(params):70} {calls / elapsed:14.1f} ops/s", file=sys.stderr)
+
+    with open(os.devnull, "w") as devnull:
+        for n in sizes:
+            for fleet_name in fleets:
+                fleet = FLEETS[fleet_name]
+                if max(fleet) > n or 2 * sum(fleet) > n * n:
+                    continue
+                grid_rng = Random(0)
+                record("utils.generate_grid", {"n": n, "fleet": fleet_name}, lambda: lambda: generate_grid(n, fleet, grid_rng))
+                for players in player_counts:
+                    for backend in backends:
+                        params: dict[str, object] = {"n": n, "players": players, "fleet": fleet_name, "backend": backend.name}
+                        for name, setup in _cases(n, players, fleet, backend, devnull).items():
+                            record(name, params, setup)
+    return results
+
+
+def import_ms(module: str, runs: int = 5) -> float:
+    # best of several cold imports in fresh interpreters, as reported by -X importtime
+    best = float("inf")
+    for _ in range(runs):
+        # run from the repo root so the import resolves wherever the benchmarks were started from
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True, cwd=_ROOT)
+        for line in proc.stderr.splitlines():
+            fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                best = min(best, int(fields[1]) / 1000)
+    return best
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _key(result: dict[str, object]) -> str:
+    return json.dumps({k: v for k, v in result.items() if k not in ("ops_per_sec", "peak_kib", "setup_peak_kib")}, sort_keys=True)
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], tolerance: float) -> list[str]:
+    # cases that got slower than baseline by more than tolerance
+    old: dict[str, dict[str, Any]] = {_key(r): r for r in baseline["results"]}
+    regressions: list[str] = []
+    for result in current["results"]:
+        before = old.get(_key(result))
+        if before is None:
+            continue
+        ratio = result["ops_per_sec"] / before["ops_per_sec"]
+        if ratio < 1 - tolerance:
+            regressions.append(f"{_key(result)}: {ratio:.2f}x of baseline")
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None, prog: str | None = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Benchmark model, view and simulation hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 64, 512, 4096])
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 3])
+    parser.add_argument("--fleets", nargs="+", choices=sorted(FLEETS), default=sorted(FLEETS))
+    parser.add_argument("--backends", nargs="+", choices=[b.name for b in BoardBackend], default=[b.name for b in BoardBackend])
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent timing each case")
+    parser.add_argument("--only", default=None, help="only run cases whose name contains this")
+    parser.add_argument("--out", default=None, help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", default=None, help="baseline JSON report to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--imports-only", action="store_true", help="only measure module import times against their budgets")
+    args = parser.parse_args(argv)
+
+    imports = {module: import_ms(module) for module in IMPORT_BUDGETS_MS}
+    over = [f"import {module}: {ms:.1f}ms over its {IMPORT_BUDGETS_MS[module]:g}ms budget" for module, ms in imports.items() if ms > IMPORT_BUDGETS_MS[module]]
+    for module, ms in imports.items():
+        print(f"{'import ' + module:28} {ms:8.1f} ms (budget {IMPORT_BUDGETS_MS[module]:g} ms)", file=sys.stderr)
+    if args.imports_only:
+        for line in over:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if over else 0)
+
+    report: dict[str, Any] = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "import_ms": imports,
+        "results": run(args.sizes, args.players, args.fleets, [BoardBackend[b] for b in args.backends], args.min_time, args.only),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            slower = compare(json.load(f), report, args.tolerance) + over
+        for line in slower:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if slower else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Protocol, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from battleship.model import BattleshipModel
+
+
+class Bot(Protocol):
+    player: int
+
+    def take_turn(self, model: BattleshipModel) -> None: ...
+    def close(self) -> None: ...
+
+
+class RandomBot:
+    # same choices the controller makes for a bot, without the view
+    def __init__(self, player: int):
+        self.player = player
+
+    def take_turn(self, model: BattleshipModel) -> None:
+        decision = model.get_random_action()
+        if decision == 'a':
+            target = model.get_random_target()
+            i, j = model.get_untried_ij(target)
+            model.shoot(i, j, target)
+        elif decision == 'b':
+            target_ship, movement = model.get_random_ship_move()
+            if target_ship and movement:
+                model.move_ship((target_ship, movement))
+        elif decision == 'c':
+            target = model.get_random_target()
+            i, j = model.get_random_ij()
+            model.scan(i, j, target)
+
+    def close(self) -> None:
+        pass
+
+
+class ObservingBot:
+    # what a bot has learned about each opponent's board from its own shots and scans
+    # subclasses keep their own model of the unseen ships through the _block, _sink and _unsettle hooks
+    def __init__(self, player: int, model: BattleshipModel):
+        self.player = player
+        self.n = model.n
+        self.ship_sizes = model.ship_sizes
+        self.targets = [t for t in range(model.players) if t != player]
+        # afloat ship cells seen by scans, and ships already known to be sunk
+        self.sightings: dict[int, set[tuple[int, int]]] = {t: set() for t in self.targets}
+        self.sunk: dict[int, set[str]] = {t: set() for t in self.targets}
+        # cells seen holding a sunk ship stay ruled out for good, misses and empty scans only until a ship moves
+        self.sunk_cells: dict[int, set[tuple[int, int]]] = {t: set() for t in self.targets}
+        self.ruled_out: dict[int, set[tuple[int, int]]] = {t: set() for t in self.targets}
+        self.moves_left = {t: model.move_ship_chances[t] for t in self.targets}
+
+    def _block(self, target: int, i: int, j: int) -> None:
+        # (i, j) can no longer hold an unseen ship
+        pass
+
+    def _sink(self, target: int, ship: str) -> None:
+        # ship, a lowercase letter, is newly known to be sunk
+        pass
+
+    def _unsettle(self, target: int) -> None:
+        # the opponent moved a ship, which may now sit on an earlier miss, so only sunk ship cells stay blocked
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def _observe(self, model: BattleshipModel, target: int, i: int, j: int) -> None:
+        char = model.boards[target].cell(i, j)
+        self._block(target, i, j)
+        self.ruled_out[target].add((i, j))
+        if char.isupper():
+            self.sightings[target].add((i, j))
+            return
+        self.sightings[target].discard((i, j))
+        if char != ".":
+            self.sunk_cells[target].add((i, j))
+            if char not in self.sunk[target]:
+                self.sunk[target].add(char)
+                self._sink(target, char)
+
+    def _live_targets(self, model: BattleshipModel) -> list[int]:
+        # living opponents, after catching up on any ship they moved since the last turn
+        targets = [t for t in self.targets if not model.players_dead[t]]
+        for t in targets:
+            if model.move_ship_chances[t] != self.moves_left[t]:
+                self.moves_left[t] = model.move_ship_chances[t]
+                self.ruled_out[t] = set(self.sunk_cells[t])
+                self._unsettle(t)
+        return targets
+
+    def _shoot_sighting(self, model: BattleshipModel, targets: Sequence[int]) -> bool:
+        # a ship seen by a scan and still there is a guaranteed sink
+        for t in targets:
+            for i, j in list(self.sightings[t]):
+                if model.boards[t].cell(i, j).isupper():
+                    model.shoot(i, j, t)
+                    self._observe(model, t, i, j)
+                    return True
+                self._observe(model, t, i, j)
+        return False
+
+    def _fallback(self, model: BattleshipModel, targets: Sequence[int]) -> tuple[int, int, int]:
+        # nothing points anywhere, so any cell not ruled out yet, and any cell at all once every one is
+        n = self.n
+        rng = model.player_rng(self.player)
+        t = rng.choice(targets)
+        ruled_out = self.ruled_out[t]
+        cells = [idx for idx in range(n * n) if divmod(idx, n) not in ruled_out] or list(range(n * n))
+        i, j = divmod(rng.choice(cells), n)
+        return t, i, j
+
+
+BOT_NAMES = ("random", "heatmap", "montecarlo")
+# bump a strategy's version whenever its play changes, cached tournament results are keyed on it
+BOT_VERSIONS: dict[str, int] = {
+    "random": 1,
+    "heatmap": 3,
+    "montecarlo": 3,
+}
+
+
+def make_bot(name: str, player: int, model: BattleshipModel) -> Bot:
+    # strategies needing numpy are only imported when asked for
+    if name == "random":
+        return RandomBot(player)
+    if name == "heatmap":
+        from heatmap_bot import HeatmapBot
+        return HeatmapBot(player, model)
+    if name == "montecarlo":
+        from montecarlo_bot import MonteCarloBot
+        return MonteCarloBot(player, model)
+    raise ValueError(f"Unknown bot strategy {name!r}, expected one of {BOT_NAMES}")
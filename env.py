@@ -0,0 +1,195 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from random import Random
+from string import ascii_uppercase
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from battleship.boards import DIRECTIONS, BoardBackend
+from battleship.model import BattleshipModel, TurnAction
+from battleship.streams import RandomStreams
+from bots import Bot, make_bot
+
+# observation codes, a player's own board is WATER / AFLOAT / SUNK
+# and an opponent's board is UNSEEN until revealed by a shot or a scan
+UNSEEN, WATER, AFLOAT, SUNK = 0, 1, 2, 3
+# moves are encoded with the ship index as the target and the index in DIRECTIONS as i
+
+_CODES = np.full(256, SUNK, dtype=np.int8)
+_CODES[ord(".")] = WATER
+_CODES[[ord(c) for c in ascii_uppercase]] = AFLOAT
+
+
+def _encode(rows: Sequence[str]) -> NDArray[np.int8]:
+    return _CODES[np.frombuffer("".join(rows).encode(), dtype=np.uint8)]
+
+
+class BattleshipEnv:
+    # reset/step wrapper around one BattleshipModel, the agent plays seat and bots play everyone else
+    # observation[p] is the agent's own board for p == seat and its fog-of-war view of p otherwise
+    def __init__(self,
+        n: int = 6,
+        k: int = 2,
+        ship_sizes: Sequence[int] = (4, 3, 2, 2),
+        players: int = 2,
+        max_powerup_uses: int = 3,
+        opponents: str = "random",
+        seat: int = 0,
+        backend: BoardBackend = BoardBackend.LIST,
+        out: NDArray[np.int8] | None = None,
+        powerups_out: NDArray[np.int16] | None = None,
+        ):
+        self.n = n
+        self.k = k
+        self.ship_sizes = tuple(ship_sizes)
+        self.players = players
+        self.max_powerup_uses = max_powerup_uses
+        self.opponents = opponents
+        self.seat = seat
+        self.backend = backend
+        self.model = BattleshipModel(n=n, k=k, ship_sizes=ship_sizes, rng=Random(), players=players, max_powerup_uses=max_powerup_uses, backend=backend)
+        self.bots: list[Bot | None] = []
+
+        # buffers are written in place on every step, a vectorized env hands in views of its own
+        self.observation = out if out is not None else np.zeros((players, n, n), dtype=np.int8)
+        # move_ship and scan chances left for the agent
+        self.powerups = powerups_out if powerups_out is not None else np.zeros(2, dtype=np.int16)
+        self._obs: dict[str, NDArray[Any]] = {"boards": self.observation, "powerups": self.powerups}
+        self._info: dict[str, Any] = {}
+        self._ships_left: list[int] = []
+        self._moves_left: list[int] = []
+
+    def reset(self, seed: int | str | None = None) -> tuple[dict[str, NDArray[Any]], dict[str, Any]]:
+        # a seeded episode draws every seat's placement and play from its own stream
+        model = self.model
+        model.rng = Random(seed)
+        model.setup(self.players, RandomStreams(seed) if seed is not None else None)
+        self.close()
+        self.bots = [None if p == self.seat else make_bot(self.opponents, p, model) for p in range(self.players)]
+        self._ships_left = list(model.ships_left)
+        self._moves_left = list(model.move_ship_chances)
+
+        self.observation.fill(UNSEEN)
+        self._refresh(self.seat)
+        self._play_opponents()
+        self._update_powerups()
+        return self._obs, self._info
+
+    def step(self, action: int, target: int, i: int, j: int) -> tuple[dict[str, NDArray[Any]], float, bool, bool, dict[str, Any]]:
+        # one agent action, then every bot turn until the agent is up again or the game ends
+        model = self.model
+        seat = self.seat
+        sunk_before = sum(self._ships_left) - self._ships_left[seat]
+
+        if action == TurnAction.SHOOT.value:
+            model.shoot(i, j, target)
+            self.observation[target, i, j] = _CODES[ord(model.boards[target].cell(i, j))]
+        elif action == TurnAction.SCAN.value:
+            if model.scan_chances[seat] > 0:
+                model.scan(i, j, target)
+                n, k = self.n, self.k
+                board = model.boards[target]
+                for r in range(max(i, 0), min(i + k, n)):
+                    for c in range(max(j, 0), min(j + k, n)):
+                        self.observation[target, r, c] = _CODES[ord(board.cell(r, c))]
+        elif model.move_ship_chances[seat] > 0:
+            # only legal moves are made, an illegal one leaves the board and the chance as they were
+            ship, movement = ascii_uppercase[target], DIRECTIONS[i]
+            if model.boards[seat].can_move(ship, movement):
+                model.move_ship((ship, movement))
+                self._refresh(seat)
+        self._sync()
+        reward = float(sunk_before - (sum(self._ships_left) - self._ships_left[seat]))
+
+        model.go_to_next_turn()
+        self._play_opponents()
+        self._update_powerups()
+        terminated = model.is_game_over() or model.players_dead[seat]
+        if terminated and model.is_game_over():
+            reward += 1.0 if model.winner() == seat else -1.0
+        return self._obs, reward, terminated, False, self._info
+
+    def close(self) -> None:
+        # bots may hold worker pools of their own
+        for bot in self.bots:
+            if bot is not None:
+                bot.close()
+        self.bots = []
+
+    def _play_opponents(self) -> None:
+        model = self.model
+        while not model.is_game_over() and model.turn != self.seat:
+            bot = self.bots[model.turn]
+            if bot is not None:
+                bot.take_turn(model)
+            self._sync()
+            model.go_to_next_turn()
+
+    def _sync(self) -> None:
+        # redraw a board only when a ship sank or moved on it, both happen a bounded number of times per game
+        model = self.model
+        for p in range(self.players):
+            if model.ships_left[p] != self._ships_left[p] or model.move_ship_chances[p] != self._moves_left[p]:
+                self._ships_left[p] = model.ships_left[p]
+                self._moves_left[p] = model.move_ship_chances[p]
+                self._refresh(p)
+
+    def _refresh(self, p: int) -> None:
+        cells = _encode(self.model.boards[p].rows())
+        if p != self.seat:
+            seen = self.model.knowledge.all_maps().get((self.seat, p))
+            if seen is None:
+                return
+            cells[np.frombuffer(seen, dtype=np.uint8) == 0] = UNSEEN
+        self.observation[p] = cells.reshape(self.n, self.n)
+
+    def _update_powerups(self) -> None:
+        self.powerups[0] = self.model.move_ship_chances[self.seat]
+        self.powerups[1] = self.model.scan_chances[self.seat]
+
+
+class VectorBattleshipEnv:
+    # many environments stepped in one call, their observations are views into one (E, P, n, n) array
+    # an environment that terminates is reset straight away, as vectorized gym environments do
+    def __init__(self, num_envs: int, seed: int = 0, **kwargs: Any):
+        players: int = kwargs.get("players", 2)
+        n: int = kwargs.get("n", 6)
+        self.num_envs = num_envs
+        self.seed = seed
+        self.observations = np.zeros((num_envs, players, n, n), dtype=np.int8)
+        self.powerups = np.zeros((num_envs, 2), dtype=np.int16)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=np.bool_)
+        self.truncated = np.zeros(num_envs, dtype=np.bool_)
+        self.envs = [BattleshipEnv(out=self.observations[e], powerups_out=self.powerups[e], **kwargs) for e in range(num_envs)]
+        self._episodes = [0] * num_envs
+        self._obs: dict[str, NDArray[Any]] = {"boards": self.observations, "powerups": self.powerups}
+
+    def _reset_env(self, e: int) -> None:
+        self.envs[e].reset(f"{self.seed}/{e}/{self._episodes[e]}")
+        self._episodes[e] += 1
+
+    def reset(self) -> dict[str, NDArray[Any]]:
+        for e in range(self.num_envs):
+            self._reset_env(e)
+        return self._obs
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
+
+    def step(self, actions: NDArray[np.integer]) -> tuple[dict[str, NDArray[Any]], NDArray[np.float32], NDArray[np.bool_], NDArray[np.bool_]]:
+        # actions is (E, 4) of (action, target, i, j) rows
+        for e, env in enumerate(self.envs):
+            action, target, i, j = actions[e].tolist()
+            _, reward, terminated, _, _ = env.step(action, target, i, j)
+            self.rewards[e] = reward
+            self.terminated[e] = terminated
+            if terminated:
+                self._reset_env(e)
+        return self._obs, self.rewards, self.terminated, self.truncated
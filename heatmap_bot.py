@@ -0,0 +1,133 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from string import ascii_lowercase
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from bots import ObservingBot
+
+if TYPE_CHECKING:
+    from battleship.model import BattleshipModel
+
+
+class TargetHeatmap:
+    # placement counts of every remaining ship size over one opponent's board
+    def __init__(self, n: int, ship_sizes: Sequence[int]):
+        self.n = n
+        self.blocked = np.zeros((n, n), dtype=np.bool_)
+        self.remaining: dict[int, int] = {}
+        for size in ship_sizes:
+            self.remaining[size] = self.remaining.get(size, 0) + 1
+
+        # free[size] marks legal starts (horizontal, vertical), cover[size] counts legal placements per cell
+        self.free: dict[int, tuple[NDArray[np.bool_], NDArray[np.bool_]]] = {}
+        self.cover: dict[int, NDArray[np.int32]] = {}
+        self.count: dict[int, int] = {}
+        idx = np.arange(n)
+        for size in self.remaining:
+            if size > n:
+                continue
+            starts = n - size + 1
+            self.free[size] = (np.ones((n, starts), dtype=np.bool_), np.ones((starts, n), dtype=np.bool_))
+            # starts j with j <= c <= j + size - 1
+            line = (np.minimum(idx, n - size) - np.maximum(0, idx - size + 1) + 1).astype(np.int32)
+            self.cover[size] = line[None, :] + line[:, None] if size > 1 else np.ones((n, n), dtype=np.int32)
+            self.count[size] = 2 * n * starts if size > 1 else n * n
+
+    def block(self, i: int, j: int) -> None:
+        # (i, j) can no longer hold an unseen ship, drop every placement through it
+        if self.blocked[i, j]:
+            return
+        self.blocked[i, j] = True
+        n = self.n
+        for size, (free_h, free_v) in self.free.items():
+            cover = self.cover[size]
+            lo, hi = max(0, j - size + 1), min(j, n - size)
+            for start in np.flatnonzero(free_h[i, lo:hi + 1]) + lo:
+                free_h[i, start] = False
+                cover[i, start:start + size] -= 1
+                self.count[size] -= 1
+            if size == 1:
+                # a single cell has one placement, counted once above
+                free_v[i, j] = False
+                continue
+            lo, hi = max(0, i - size + 1), min(i, n - size)
+            for start in np.flatnonzero(free_v[lo:hi + 1, j]) + lo:
+                free_v[start, j] = False
+                cover[start:start + size, j] -= 1
+                self.count[size] -= 1
+
+    def sink(self, size: int) -> None:
+        if self.remaining.get(size, 0) > 0:
+            self.remaining[size] -= 1
+
+    def probabilities(self) -> NDArray[np.float64]:
+        # expected number of remaining ships covering each unseen cell
+        prob = np.zeros((self.n, self.n), dtype=np.float64)
+        for size, left in self.remaining.items():
+            if left and self.count.get(size, 0) > 0:
+                prob += self.cover[size] * (left / self.count[size])
+        prob[self.blocked] = 0.0
+        return prob
+
+
+class HeatmapBot(ObservingBot):
+    def __init__(self, player: int, model: BattleshipModel):
+        super().__init__(player, model)
+        self.heatmaps = {t: TargetHeatmap(model.n, model.ship_sizes) for t in self.targets}
+
+    def _block(self, target: int, i: int, j: int) -> None:
+        self.heatmaps[target].block(i, j)
+
+    def _sink(self, target: int, ship: str) -> None:
+        self.heatmaps[target].sink(self.ship_sizes[ascii_lowercase.index(ship)])
+
+    def _unsettle(self, target: int) -> None:
+        heatmap = TargetHeatmap(self.n, self.ship_sizes)
+        heatmap.remaining = dict(self.heatmaps[target].remaining)
+        for i, j in self.sunk_cells[target]:
+            heatmap.block(i, j)
+        self.heatmaps[target] = heatmap
+
+    def take_turn(self, model: BattleshipModel) -> None:
+        targets = self._live_targets(model)
+        if self._shoot_sighting(model, targets):
+            return
+
+        best: tuple[float, int, int, int] = (0.0, targets[0], -1, -1)
+        best_window: tuple[float, int, int, int] = (-1.0, targets[0], 0, 0)
+        k, n = model.k, model.n
+        for t in targets:
+            prob = self.heatmaps[t].probabilities()
+            cell = int(prob.argmax())
+            if prob.flat[cell] > best[0]:
+                best = (float(prob.flat[cell]), t, cell // n, cell % n)
+            if model.scan_chances[self.player] > 0 and 1 < k <= n:
+                cs = np.zeros((n + 1, n + 1))
+                cs[1:, 1:] = prob.cumsum(axis=0).cumsum(axis=1)
+                window = cs[k:, k:] - cs[:-k, k:] - cs[k:, :-k] + cs[:-k, :-k]
+                top = int(window.argmax())
+                if window.flat[top] > best_window[0]:
+                    width = n - k + 1
+                    best_window = (float(window.flat[top]), t, top // width, top % width)
+
+        # scan when the window is expected to hold a ship and no single cell is a likely hit
+        if best_window[0] >= 1.0 and best[0] < 0.5:
+            _, t, i, j = best_window
+            model.scan(i, j, t)
+            for r in range(i, i + k):
+                for c in range(j, j + k):
+                    self._observe(model, t, r, c)
+            return
+
+        # an all-zero heatmap has no best cell, argmax would point at cell 0 whether shot or not
+        _, t, i, j = best
+        if i < 0:
+            t, i, j = self._fallback(model, targets)
+        model.shoot(i, j, t)
+        self._observe(model, t, i, j)
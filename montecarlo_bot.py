@@ -0,0 +1,120 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from string import ascii_lowercase
+from typing import TYPE_CHECKING
+import time
+
+from battleship.utils import LayoutSampler
+from bots import ObservingBot
+
+if TYPE_CHECKING:
+    from battleship.model import BattleshipModel
+
+# per-process count buffers and their zero templates, reused across moves
+_counts_cache: dict[int, tuple[array[int], array[int]]] = {}
+
+
+def sample_counts(n: int, ship_sizes: Sequence[int], blocked: Sequence[tuple[int, int]], seed: str, max_samples: int, budget: float | None = None) -> tuple[int, array[int]]:
+    # returns (layouts drawn, how often each cell i * n + j held a ship)
+    # a time budget may stop early, and then how many layouts were drawn depends on the machine
+    cached = _counts_cache.get(n)
+    if cached is None:
+        cached = _counts_cache[n] = (array("I", bytes(4 * n * n)), array("I", bytes(4 * n * n)))
+    counts, zeros = cached
+    counts[:] = zeros
+
+    rng = Random(seed)
+    sampler = LayoutSampler(n, ship_sizes, blocked)
+    # a ship with nowhere left to go means no layout fits at all
+    if any(not sampler.index.count("H", size) and not sampler.index.count("V", size) for size in ship_sizes):
+        return 0, counts
+    deadline = time.perf_counter() + budget if budget is not None else None
+    samples = 0
+    attempts = 0
+    # ships may still fit one by one but not together, so failed attempts are capped too
+    while samples < max_samples and attempts < 16 * max_samples:
+        if sampler.sample(rng, counts):
+            samples += 1
+        attempts += 1
+        if deadline is not None and attempts % 16 == 0 and time.perf_counter() >= deadline:
+            break
+    return samples, counts
+
+
+class MonteCarloBot(ObservingBot):
+    # seeded games replay exactly with the default fixed sample count, a time budget trades that for a bound on time per move
+    def __init__(self, player: int, model: BattleshipModel, max_samples: int = 2000, budget: float | None = None, workers: int = 1):
+        super().__init__(player, model)
+        self.max_samples = max_samples
+        self.budget = budget
+        self.workers = workers
+        self.rng = Random(model.player_rng(player).getrandbits(64))
+        self.moves = 0
+        self._pool: ProcessPoolExecutor | None = None
+        # cells known to hold no unseen ship
+        self.blocked: dict[int, set[tuple[int, int]]] = {t: set() for t in self.targets}
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _block(self, target: int, i: int, j: int) -> None:
+        self.blocked[target].add((i, j))
+
+    def _unsettle(self, target: int) -> None:
+        self.blocked[target] = set(self.sunk_cells[target])
+
+    def _remaining(self, target: int) -> list[int]:
+        sunk = self.sunk[target]
+        return [size for idx, size in enumerate(self.ship_sizes) if ascii_lowercase[idx] not in sunk]
+
+    def _counts(self, target: int, budget: float | None) -> tuple[int, array[int]]:
+        args = (self.n, self._remaining(target), sorted(self.blocked[target]))
+        seed = f"{self.rng.getrandbits(64)}/{self.moves}/{target}"
+        if self.workers <= 1:
+            return sample_counts(*args, seed, self.max_samples, budget)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        share = -(-self.max_samples // self.workers)
+        futures = [self._pool.submit(sample_counts, *args, f"{seed}/{w}", share, budget) for w in range(self.workers)]
+        samples = 0
+        counts = array("I", bytes(4 * self.n * self.n))
+        for future in futures:
+            part_samples, part = future.result()
+            samples += part_samples
+            for idx, c in enumerate(part):
+                if c:
+                    counts[idx] += c
+        return samples, counts
+
+    def take_turn(self, model: BattleshipModel) -> None:
+        self.moves += 1
+        targets = self._live_targets(model)
+        if self._shoot_sighting(model, targets):
+            return
+
+        n = self.n
+        best: tuple[float, int, int] = (0.0, targets[0], -1)
+        for t in targets:
+            samples, counts = self._counts(t, self.budget / len(targets) if self.budget is not None else None)
+            blocked = self.blocked[t]
+            cell = max((idx for idx in range(n * n) if divmod(idx, n) not in blocked), key=counts.__getitem__, default=-1)
+            if cell >= 0 and samples and counts[cell] / samples > best[0]:
+                best = (counts[cell] / samples, t, cell)
+
+        # no layout fits what was seen, so the samples point nowhere
+        _, t, cell = best
+        if cell < 0:
+            t, i, j = self._fallback(model, targets)
+        else:
+            i, j = divmod(cell, n)
+        model.shoot(i, j, t)
+        self._observe(model, t, i, j)
@@ -0,0 +1,347 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from random import Random
+import argparse
+import asyncio
+import itertools
+
+from battleship.boards import BoardBackend
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import RandomBot
+
+# line protocol, one command or event per line, words separated by spaces
+#   client: JOIN <players> | BOTS <players> | SHOOT <target> <i> <j> | SCAN <target> <i> <j>
+#           MOVE <ship> <u/d/l/r> | VIEW | QUIT
+#   server: HELLO | MATCH <id> SEAT <seat> PLAYERS <players> N <n> K <k> | GRID <row> | WAITING <joined> <players>
+#           TURN <seat> | YOURTURN <move chances> <scan chances> | OK | ERR <reason>
+#           SHOT <seat> <target> <i> <j> HIT|MISS | SCANNED <seat> <target> | REVEAL <target> <i> <j> <cells>
+#           MOVED <seat> | TIMEOUT <seat> | ELIMINATED <seat> | VIEW <grid> <row> | END | GAMEOVER <winner>
+
+
+class Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.match: Match | None = None
+        self.seat = -1
+        self.actions: asyncio.Queue[list[str]] = asyncio.Queue()
+
+    def send(self, *lines: str) -> None:
+        if not self.writer.is_closing():
+            self.writer.write("".join(line + "\n" for line in lines).encode())
+
+
+class Match:
+    def __init__(self, match_id: int, model: BattleshipModel, seats: list[Connection | None], turn_timeout: float):
+        self.match_id = match_id
+        self.model = model
+        # None seats are played by bots, including players who disconnected
+        self.seats = seats
+        self.turn_timeout = turn_timeout
+        self._alive = set(model.live_list)
+
+    def broadcast(self, line: str) -> None:
+        for conn in self.seats:
+            if conn is not None:
+                conn.send(line)
+
+    def send_view(self, conn: Connection) -> None:
+        model = self.model
+        lines: list[str] = []
+        for g, rows in enumerate(model.grids()):
+            for r, row in enumerate(rows):
+                if g != conn.seat:
+                    seen = model.knowledge.row(conn.seat, g, r)
+                    row = "".join(ch if s else "?" for ch, s in zip(row, seen))
+                lines.append(f"VIEW {g} {row}")
+        conn.send(*lines, "END")
+
+    def leave(self, conn: Connection) -> None:
+        self.seats[conn.seat] = None
+        conn.actions.put_nowait(["QUIT"])
+
+    def _valid_target(self, seat: int, target: int) -> bool:
+        model = self.model
+        return 0 <= target < model.players and target != seat and not model.players_dead[target]
+
+    def apply(self, seat: int, words: list[str]) -> str | None:
+        # applies one action for seat, returns an error message if it was refused
+        model = self.model
+        cmd = words[0].upper()
+        try:
+            if cmd in ("SHOOT", "SCAN"):
+                target, i, j = (int(w) for w in words[1:4])
+                if len(words) != 4:
+                    return "expected <target> <i> <j>"
+            elif cmd == "MOVE":
+                if len(words) != 3:
+                    return "expected <ship> <u/d/l/r>"
+                target, i, j = -1, 0, 0
+            else:
+                return "unknown action"
+        except ValueError:
+            return "expected <target> <i> <j>"
+
+        if cmd == "MOVE":
+            ship, move = words[1].upper(), words[2].lower()
+            if model.move_ship_chances[seat] <= 0:
+                return "no move chances left"
+            if not model.boards[seat].can_move(ship, move):
+                return "invalid move"
+            model.move_ship((ship, move))
+            self.broadcast(f"MOVED {seat}")
+            return None
+
+        if not self._valid_target(seat, target):
+            return "invalid target"
+        if not (0 <= i < model.n and 0 <= j < model.n):
+            return "out of bounds"
+
+        if cmd == "SHOOT":
+            left = model.ships_left[target]
+            model.shoot(i, j, target)
+            self.broadcast(f"SHOT {seat} {target} {i} {j} {'HIT' if model.ships_left[target] < left else 'MISS'}")
+            return None
+
+        if model.scan_chances[seat] <= 0:
+            return "no scan chances left"
+        model.scan(i, j, target)
+        self.broadcast(f"SCANNED {seat} {target}")
+        conn = self.seats[seat]
+        if conn is not None:
+            board = model.boards[target]
+            conn.send(*(
+                f"REVEAL {target} {r} {j} {''.join(board.cell(r, c) for c in range(j, min(j + model.k, model.n)))}"
+                for r in range(i, min(i + model.k, model.n))
+            ))
+        return None
+
+    def _report_eliminations(self) -> None:
+        if len(self._alive) == self.model.live_players:
+            return
+        for p in sorted(self._alive - set(self.model.live_list)):
+            self.broadcast(f"ELIMINATED {p}")
+        self._alive = set(self.model.live_list)
+
+    async def _human_turn(self, conn: Connection, seat: int) -> bool:
+        # returns False if the seat has to be played by a bot this turn
+        model = self.model
+        # anything still queued was sent outside this turn, a late reply to a timed out turn for one
+        while not conn.actions.empty():
+            conn.actions.get_nowait()
+        conn.send(f"YOURTURN {model.move_ship_chances[seat]} {model.scan_chances[seat]}")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.turn_timeout
+        while True:
+            try:
+                words = await asyncio.wait_for(conn.actions.get(), max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                self.broadcast(f"TIMEOUT {seat}")
+                return False
+            if words[0] == "QUIT":
+                return False
+            error = self.apply(seat, words)
+            if error is None:
+                conn.send("OK")
+                return True
+            conn.send(f"ERR {error}")
+
+    async def run(self) -> None:
+        model = self.model
+        for seat, conn in enumerate(self.seats):
+            if conn is not None:
+                conn.match, conn.seat = self, seat
+                conn.send(f"MATCH {self.match_id} SEAT {seat} PLAYERS {model.players} N {model.n} K {model.k}")
+                conn.send(*(f"GRID {row}" for row in model.boards[seat].rows()))
+
+        while not model.is_game_over():
+            seat = model.turn
+            self.broadcast(f"TURN {seat}")
+            conn = self.seats[seat]
+            if conn is None or not await self._human_turn(conn, seat):
+                RandomBot(seat).take_turn(model)
+                # let other matches and connections run between bot turns
+                await asyncio.sleep(0)
+            self._report_eliminations()
+            model.go_to_next_turn()
+
+        self.broadcast(f"GAMEOVER {model.winner()}")
+        for conn in self.seats:
+            if conn is not None:
+                conn.match = None
+
+
+class GameServer:
+    def __init__(self, n: int = 6, k: int = 2, ship_sizes: Sequence[int] = (4, 3, 2, 2), seed: int = 0, turn_timeout: float = 30.0, idle_timeout: float = 300.0, max_players: int = 8):
+        self.n = n
+        self.k = k
+        self.ship_sizes = ship_sizes
+        self.seed = seed
+        self.turn_timeout = turn_timeout
+        self.idle_timeout = idle_timeout
+        self.max_players = max_players
+        self.lobbies: dict[int, list[Connection]] = {}
+        self.matches: set[asyncio.Task[None]] = set()
+        self._match_ids = itertools.count()
+
+    def _start_match(self, seats: list[Connection | None]) -> None:
+        match_id = next(self._match_ids)
+        streams = RandomStreams(self.seed, match_id)
+        # every live match stays resident, so boards use the compact backend
+        model = BattleshipModel(n=self.n, k=self.k, ship_sizes=self.ship_sizes, rng=streams.random("model"), streams=streams, backend=BoardBackend.COMPACT)
+        model.setup(len(seats))
+        match = Match(match_id, model, seats, self.turn_timeout)
+        for seat, conn in enumerate(seats):
+            if conn is not None:
+                conn.match, conn.seat = match, seat
+        task = asyncio.create_task(match.run())
+        self.matches.add(task)
+        task.add_done_callback(self.matches.discard)
+
+    def _lobby_command(self, conn: Connection, words: list[str]) -> None:
+        cmd = words[0].upper()
+        if cmd not in ("JOIN", "BOTS"):
+            conn.send("ERR join a match first")
+            return
+        try:
+            players = int(words[1]) if len(words) > 1 else 2
+        except ValueError:
+            players = -1
+        if not 2 <= players <= self.max_players:
+            conn.send(f"ERR players must be 2-{self.max_players}")
+            return
+
+        if cmd == "BOTS":
+            self._start_match([conn] + [None] * (players - 1))
+            return
+        lobby = self.lobbies.setdefault(players, [])
+        if conn not in lobby:
+            lobby.append(conn)
+        if len(lobby) == players:
+            del self.lobbies[players]
+            self._start_match([*lobby])
+        else:
+            conn.send(f"WAITING {len(lobby)} {players}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = Connection(reader, writer)
+        conn.send("HELLO battleship")
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    conn.send("ERR idle timeout")
+                    break
+                if not line:
+                    break
+                words = line.decode(errors="replace").split()
+                if not words:
+                    continue
+                cmd = words[0].upper()
+                if cmd == "QUIT":
+                    break
+                match = conn.match
+                if match is None:
+                    self._lobby_command(conn, words)
+                elif cmd == "VIEW":
+                    match.send_view(conn)
+                elif cmd in ("SHOOT", "SCAN", "MOVE"):
+                    if match.model.turn != conn.seat:
+                        conn.send("ERR not your turn")
+                    elif not conn.actions.empty():
+                        # one action per turn, a second would otherwise be played at the next turn
+                        conn.send("ERR action pending")
+                    else:
+                        conn.actions.put_nowait(words)
+                else:
+                    conn.send("ERR unknown command")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for lobby in self.lobbies.values():
+                if conn in lobby:
+                    lobby.remove(conn)
+            if conn.match is not None:
+                conn.match.leave(conn)
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        return await asyncio.start_server(self.handle, host, port)
+
+
+class LocalClient:
+    # a stand-in player that shoots random cells at living opponents
+    def __init__(self, seed: int | str = 0):
+        self.rng = Random(seed)
+        self.seat = -1
+        self.players = 0
+        self.n = 0
+        self.dead: set[int] = set()
+        self.my_turn = False
+        self.events: list[str] = []
+
+    async def play(self, host: str, port: int, command: str) -> int:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"{command}\n".encode())
+        try:
+            while line := (await reader.readline()).decode():
+                words = line.split()
+                self.events.append(line.rstrip("\n"))
+                if words[0] == "MATCH":
+                    self.seat, self.players, self.n = int(words[3]), int(words[5]), int(words[7])
+                elif words[0] == "ELIMINATED":
+                    self.dead.add(int(words[1]))
+                elif words[0] == "YOURTURN" or (words[0] == "ERR" and self.my_turn):
+                    self.my_turn = True
+                    targets = [p for p in range(self.players) if p != self.seat and p not in self.dead]
+                    i, j = self.rng.randrange(self.n), self.rng.randrange(self.n)
+                    writer.write(f"SHOOT {self.rng.choice(targets)} {i} {j}\n".encode())
+                elif words[0] in ("OK", "TIMEOUT"):
+                    self.my_turn = False
+                elif words[0] == "GAMEOVER":
+                    return int(words[1])
+            return -2
+        finally:
+            writer.close()
+
+
+async def demo(clients: int, players: int, seed: int) -> None:
+    server = GameServer(seed=seed, turn_timeout=5.0)
+    async with await server.start() as tcp:
+        port = tcp.sockets[0].getsockname()[1]
+        # half the clients queue for shared matches, the rest play against bots
+        shared = clients // 2 // players * players
+        commands = [f"JOIN {players}" if c < shared else f"BOTS {players}" for c in range(clients)]
+        winners = await asyncio.gather(*(LocalClient(f"{seed}/{c}").play("127.0.0.1", port, cmd) for c, cmd in enumerate(commands)))
+        print(f"{clients} clients finished, winners: {winners}")
+
+
+def main(argv: Sequence[str] | None = None, prog: str | None = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Host battleship matches over a local TCP line protocol")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-n", type=int, default=6)
+    parser.add_argument("-k", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--turn-timeout", type=float, default=30.0)
+    parser.add_argument("--demo", type=int, default=0, help="run this many local clients against an in-process server and exit")
+    parser.add_argument("--demo-players", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    async def serve() -> None:
+        server = GameServer(n=args.n, k=args.k, seed=args.seed, turn_timeout=args.turn_timeout)
+        async with await server.start(args.host, args.port) as tcp:
+            print(f"serving on {args.host}:{args.port}")
+            await tcp.serve_forever()
+
+    asyncio.run(demo(args.demo, args.demo_players, args.seed) if args.demo else serve())
+
+
+if __name__ == "__main__":
+    main()
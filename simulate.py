@@ -0,0 +1,129 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import os
+
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import Bot, make_bot
+
+
+class SimulationStats:
+    def __init__(self, players: int):
+        self.players = players
+        self.games = 0
+        self.wins = [0] * players
+        self.draws = 0
+        self.total_turns = 0
+        self.min_turns = -1
+        self.max_turns = 0
+
+    def add_game(self, winner: int, turns: int) -> None:
+        self.games += 1
+        if winner == -1:
+            self.draws += 1
+        else:
+            self.wins[winner] += 1
+        self.total_turns += turns
+        self.min_turns = turns if self.min_turns == -1 else min(self.min_turns, turns)
+        self.max_turns = max(self.max_turns, turns)
+
+    def merge(self, other: SimulationStats) -> None:
+        self.games += other.games
+        self.wins = [a + b for a, b in zip(self.wins, other.wins)]
+        self.draws += other.draws
+        self.total_turns += other.total_turns
+        if other.min_turns != -1:
+            self.min_turns = other.min_turns if self.min_turns == -1 else min(self.min_turns, other.min_turns)
+        self.max_turns = max(self.max_turns, other.max_turns)
+
+    def mean_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "draws": self.draws,
+            "win_rates": [w / self.games if self.games else 0.0 for w in self.wins],
+            "mean_turns": self.mean_turns(),
+            "min_turns": self.min_turns,
+            "max_turns": self.max_turns,
+        }
+
+
+def play_game(model: BattleshipModel, bots: Sequence[Bot], max_turns: int | None = None) -> tuple[int, int]:
+    # returns (winner, turns), a game cut off at max_turns counts as a draw
+    turns = 0
+    while not model.is_game_over():
+        if max_turns is not None and turns >= max_turns:
+            return -1, turns
+        bots[model.turn].take_turn(model)
+        model.go_to_next_turn()
+        turns += 1
+    return model.winner(), turns
+
+
+def _game_streams(seed: int, game: int) -> RandomStreams:
+    # every game, seat and purpose gets its own stream so results do not depend on how games are split
+    return RandomStreams(seed, game)
+
+
+def _simulate_chunk(first_game: int, last_game: int, n: int, k: int, players: int, ship_sizes: Sequence[int], seed: int, max_turns: int | None, strategies: Sequence[str]) -> SimulationStats:
+    stats = SimulationStats(players)
+    for game in range(first_game, last_game):
+        streams = _game_streams(seed, game)
+        model = BattleshipModel(n=n, k=k, ship_sizes=ship_sizes, rng=streams.random("model"), players=players, streams=streams)
+        model.setup(players)
+        bots = [make_bot(strategies[p], p, model) for p in range(players)]
+        stats.add_game(*play_game(model, bots, max_turns))
+        # bots may hold worker pools of their own
+        for bot in bots:
+            bot.close()
+    return stats
+
+
+def simulate(games: int, n: int = 6, k: int = 2, players: int = 2, ship_sizes: Sequence[int] = (4, 3, 2, 2), seed: int = 0, workers: int | None = None, max_turns: int | None = None, strategies: Sequence[str] | None = None) -> SimulationStats:
+    # one strategy name per seat, see bots.make_bot
+    strategies = tuple(strategies or ("random",) * players)
+    workers = workers or os.cpu_count() or 1
+    # a few chunks per worker keeps every core busy without shipping one task per game
+    chunk = max(1, games // (workers * 4))
+    bounds = [(start, min(start + chunk, games)) for start in range(0, games, chunk)]
+
+    stats = SimulationStats(players)
+    if workers == 1:
+        for start, end in bounds:
+            stats.merge(_simulate_chunk(start, end, n, k, players, ship_sizes, seed, max_turns, strategies))
+        return stats
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_simulate_chunk, start, end, n, k, players, ship_sizes, seed, max_turns, strategies) for start, end in bounds]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+def main(argv: Sequence[str] | None = None, prog: str | None = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Run bot-vs-bot battleship games without a view")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("-n", type=int, default=6)
+    parser.add_argument("-k", type=int, default=2)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--ships", type=int, nargs="+", default=[4, 3, 2, 2])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-turns", type=int, default=None)
+    parser.add_argument("--strategies", nargs="+", default=None, help="one bot strategy per seat")
+    args = parser.parse_args(argv)
+
+    result = simulate(args.games, args.n, args.k, args.players, args.ships, args.seed, args.workers, args.max_turns, args.strategies)
+    print(result.as_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from random import Random
+from string import ascii_uppercase
+
+import numpy as np
+
+from battleship.boards import DIRECTIONS
+from battleship.model import BattleshipModel
+from batch_engine import MOVE, SCAN, SHOOT, BatchEngine
+
+
+def test_engine_matches_models_step_for_step() -> None:
+    # 64 three-player games played on BattleshipModel and on the engine with the same actions
+    games, players = 64, 3
+    models: list[BattleshipModel] = []
+    for g in range(games):
+        model = BattleshipModel(n=8, k=2, rng=Random(g))
+        model.setup(players)
+        models.append(model)
+    engine = BatchEngine.from_models(models)
+    rng = Random(99)
+
+    for step in range(400):
+        action, target, i, j = (np.zeros(games, dtype=np.int64) for _ in range(4))
+        for g, model in enumerate(models):
+            if model.is_game_over():
+                continue
+            decision = model.get_random_action()
+            t = model.get_random_target()
+            r, c = model.get_random_ij()
+            if decision == "b":
+                ship, movement = model.get_random_ship_move()
+                # blocked and off-axis moves leave the board and the chance alone in both
+                if rng.random() < 0.3:
+                    ship, movement = rng.choice("ABCD"), rng.choice(DIRECTIONS)
+                if ship and model.boards[model.turn].can_move(ship, movement):
+                    model.move_ship((ship, movement))
+                action[g], target[g], i[g] = MOVE, ascii_uppercase.index(ship or "A"), DIRECTIONS.index(movement or "u")
+                if not ship:
+                    # ship A of the default fleet never moves off its axis
+                    i[g] = 0 if not engine.ship_vertical[g, model.turn, 0] else 2
+            elif decision == "c":
+                model.scan(r, c, t)
+                action[g], target[g], i[g], j[g] = SCAN, t, r, c
+            else:
+                model.shoot(r, c, t)
+                action[g], target[g], i[g], j[g] = SHOOT, t, r, c
+            model.go_to_next_turn()
+        engine.step(action, target, i, j)
+
+        for g, model in enumerate(models):
+            assert engine.grids(g) == model.grids(), (step, g)
+            assert (engine.turn[g], engine.turn_count[g]) == (model.turn, model.turn_count), (step, g)
+            assert engine.move_ship_chances[g].tolist() == model.move_ship_chances, (step, g)
+            assert engine.scan_chances[g].tolist() == model.scan_chances, (step, g)
+            assert engine.players_dead[g].tolist() == model.players_dead, (step, g)
+            for (observer, t), cells in model.knowledge.all_maps().items():
+                assert engine.knowledge[g, observer, t].tobytes() == bytes(cells), (step, g)
+    assert all(model.is_game_over() for model in models)
+
+
+def test_random_moves_are_legal_whenever_a_legal_move_exists() -> None:
+    engine = BatchEngine(512, players=2, n=6)
+    engine.reset(1)
+    rng = np.random.default_rng(0)
+    while engine.active().any():
+        legal = engine.legal_moves()
+        action, target, i, j = engine.random_actions(rng)
+        moving = (action == MOVE) & legal.any(axis=(1, 2))
+        assert legal[moving, target[moving], i[moving]].all()
+        engine.step(action, target, i, j)
@@ -0,0 +1,62 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from random import Random
+
+import pytest
+
+from battleship.model import BattleshipModel
+from battleship.boards import BoardBackend, make_board
+
+
+def _play(backend: BoardBackend, seed: int, n: int = 8, players: int = 3) -> list[list[list[str]]]:
+    # random actions straight on the model, every board of every turn
+    model = BattleshipModel(n=n, rng=Random(seed), backend=backend)
+    model.setup(players)
+    frames: list[list[list[str]]] = []
+    while not model.is_game_over():
+        action = model.get_random_action()
+        if action == "a":
+            target = model.get_random_target()
+            i, j = model.get_random_ij()
+            model.shoot(i, j, target)
+        elif action == "b":
+            ship, movement = model.get_random_ship_move()
+            if ship:
+                model.move_ship((ship, movement))
+        else:
+            target = model.get_random_target()
+            i, j = model.get_random_ij()
+            model.scan(i, j, target)
+        frames.append(model.grids())
+        model.go_to_next_turn()
+    return frames
+
+
+@pytest.mark.parametrize("backend", [BoardBackend.BITBOARD, BoardBackend.COMPACT])
+def test_backends_play_like_list_board(backend: BoardBackend) -> None:
+    for seed in range(50):
+        assert _play(backend, seed) == _play(BoardBackend.LIST, seed), seed
+
+
+@pytest.mark.parametrize("backend", list(BoardBackend))
+def test_illegal_moves_leave_board_and_chance(backend: BoardBackend) -> None:
+    grid = [list(row) for row in ("AA....", "......", "B.....", "B.....", "......", "..CC..")]
+    model = BattleshipModel(n=6, rng=Random(0), backend=backend)
+    model.setup(2)
+    model.boards[0] = make_board(grid, backend)
+    board = model.boards[0]
+    board.shoot(5, 2)
+    rows = board.rows()
+    # a sunk ship, an unknown or empty ship, off the board and across the ship's axis
+    for ship, movement in (("C", "l"), ("Z", "d"), ("", ""), ("A", "l"), ("A", "d")):
+        model.move_ship((ship, movement))
+        board.move(ship, movement)
+        assert board.rows() == rows, (ship, movement)
+    assert model.move_ship_chances[0] == 3
+    # the sunk ship is still counted once when shot again
+    board.shoot(5, 3)
+    assert board.alive_ships == 2
+    model.move_ship(("B", "d"))
+    assert board.cell(4, 0) == "B" and model.move_ship_chances[0] == 2
@@ -0,0 +1,30 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from string import ascii_uppercase
+
+from battleship.boards import DIRECTIONS
+from battleship.model import TurnAction
+from env import BattleshipEnv
+
+
+def _positions(env: BattleshipEnv) -> list[str]:
+    # opponents may sink the agent's ships during the step, that only changes the case
+    return [row.upper() for row in env.model.boards[env.seat].rows()]
+
+
+def test_only_legal_moves_spend_a_chance() -> None:
+    env = BattleshipEnv(n=8, seat=0)
+    env.reset(1)
+    before = _positions(env)
+    # sliding a ship across its own axis is never legal
+    across = "u" if any(row.count("A") > 1 for row in before) else "l"
+    obs, _, _, _, _ = env.step(TurnAction.MOVE.value, 0, DIRECTIONS.index(across), 0)
+    assert _positions(env) == before
+    assert obs["powerups"][0] == env.max_powerup_uses
+
+    ship, movement = env.model.legal_moves(env.seat)[0]
+    obs, _, _, _, _ = env.step(TurnAction.MOVE.value, ascii_uppercase.index(ship), DIRECTIONS.index(movement), 0)
+    assert _positions(env) != before
+    assert obs["powerups"][0] == env.max_powerup_uses - 1
@@ -0,0 +1,38 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from battleship.eventlog import EventLog, Replay
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import RandomBot
+
+
+def _state(model: BattleshipModel) -> tuple[object, ...]:
+    maps = {pair: bytes(cells) for pair, cells in model.knowledge.all_maps().items() if any(cells)}
+    untried = {pair: pool.pack() for pair, pool in model.untried.items()}
+    return (model.turn_count, model.turn, model.grids(), list(model.move_ship_chances), list(model.scan_chances), list(model.players_dead), maps, untried)
+
+
+def test_model_at_matches_live_play_at_every_turn(tmp_path: Path) -> None:
+    path = str(tmp_path / "game.log")
+    streams = RandomStreams(7)
+    model = BattleshipModel(n=6, rng=streams.random("model"), players=3, streams=streams)
+    model.setup(3)
+    log = EventLog(path, model, seed=7, snapshot_every=10)
+    bots = [RandomBot(p) for p in range(3)]
+
+    states = [_state(model)]
+    while not model.is_game_over():
+        bots[model.turn].take_turn(model)
+        model.go_to_next_turn()
+        states.append(_state(model))
+    log.close()
+
+    replay = Replay(path)
+    # the snapshot turns are where a stale snapshot would show up
+    assert len(states) > 30
+    for turn, state in enumerate(states):
+        assert _state(replay.model_at(turn)) == state, turn
@@ -0,0 +1,31 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import make_bot
+from simulate import play_game
+
+
+def test_heatmap_never_reshoots_a_miss_between_moves() -> None:
+    # random opponents move ships onto cells the heatmap had ruled out, which used to zero it
+    for game in range(150):
+        streams = RandomStreams(3, game)
+        model = BattleshipModel(n=8, rng=streams.random("model"), players=2, streams=streams)
+        model.setup(2)
+        bots = [make_bot("heatmap", 0, model), make_bot("random", 1, model)]
+        shoot = model.shoot
+        # move chances the opponent had left when each cell was shot
+        shot: dict[tuple[int, int, int], int] = {}
+
+        def recording_shoot(i: int, j: int, target: int | None = None) -> None:
+            if model.turn == 0 and target is not None:
+                # a ship may have moved onto an earlier miss, but without a move in between a miss stays a miss
+                moved = shot.get((target, i, j), -1) != model.move_ship_chances[target]
+                assert moved or model.boards[target].cell(i, j).isupper(), (game, model.turn_count)
+                shot[(target, i, j)] = model.move_ship_chances[target]
+            shoot(i, j, target)
+
+        model.shoot = recording_shoot
+        play_game(model, bots)
@@ -0,0 +1,25 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import make_bot
+from simulate import play_game
+
+
+def _game(seed: int) -> tuple[int, int, list[list[str]]]:
+    streams = RandomStreams(seed)
+    model = BattleshipModel(n=6, rng=streams.random("model"), players=2, streams=streams)
+    model.setup(2)
+    bots = [make_bot("montecarlo", 0, model), make_bot("random", 1, model)]
+    winner, turns = play_game(model, bots)
+    for bot in bots:
+        bot.close()
+    return winner, turns, model.grids()
+
+
+def test_seeded_games_replay_exactly() -> None:
+    # the default sample count does not depend on how fast the machine is
+    for seed in range(3):
+        assert _game(seed) == _game(seed)
@@ -0,0 +1,54 @@
+# pyright: strict
+
+from __future__ import annotations
+
+import asyncio
+
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from server import Connection, GameServer, LocalClient, Match
+
+
+def test_local_client_finishes_a_match_against_bots() -> None:
+    async def play() -> int:
+        async with await GameServer(seed=1, turn_timeout=5.0).start() as tcp:
+            port = tcp.sockets[0].getsockname()[1]
+            return await LocalClient(1).play("127.0.0.1", port, "BOTS 3")
+
+    assert asyncio.run(play()) in (0, 1, 2)
+
+
+def test_action_queued_outside_a_turn_is_dropped() -> None:
+    async def play() -> list[str]:
+        accepted: asyncio.Queue[Connection] = asyncio.Queue()
+
+        async def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            accepted.put_nowait(Connection(reader, writer))
+
+        async with await asyncio.start_server(accept, "127.0.0.1", 0) as tcp:
+            port = tcp.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            conn = await accepted.get()
+            streams = RandomStreams(1)
+            model = BattleshipModel(n=6, rng=streams.random("model"), streams=streams)
+            model.setup(2)
+            match = Match(0, model, [conn, None], 5.0)
+            conn.seat = 0
+            # a second shot left over from an earlier turn
+            conn.actions.put_nowait(["SHOOT", "1", "0", "1"])
+            turn = asyncio.create_task(match._human_turn(conn, 0))  # pyright: ignore[reportPrivateUsage]
+            await asyncio.sleep(0)
+            conn.actions.put_nowait(["SHOOT", "1", "0", "0"])
+            assert await turn
+            lines: list[str] = []
+            try:
+                while True:
+                    lines.append((await asyncio.wait_for(reader.readline(), 0.2)).decode().rstrip("\n"))
+            except asyncio.TimeoutError:
+                pass
+            writer.close()
+            conn.writer.close()
+            return lines
+
+    lines = asyncio.run(play())
+    assert [line.rsplit(" ", 1)[0] for line in lines if line.startswith("SHOT")] == ["SHOT 0 1 0 0"]
@@ -0,0 +1,16 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from simulate import SimulationStats, simulate
+
+
+def _run(workers: int) -> SimulationStats:
+    return simulate(24, n=6, seed=5, workers=workers, strategies=["heatmap", "random"])
+
+
+def test_results_do_not_depend_on_workers() -> None:
+    # workers change how games are chunked and where they run, never what happens in them
+    serial = _run(1).as_dict()
+    assert _run(3).as_dict() == serial
+    assert serial["games"] == 24
@@ -0,0 +1,96 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from pathlib import Path
+from random import Random
+
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import RandomBot
+
+
+def _match(seed: int) -> BattleshipModel:
+    model = BattleshipModel(n=8, rng=Random(seed), players=3)
+    model.setup(3, RandomStreams(seed))
+    for turn, target, i, j in ((0, 1, 5, 5), (1, 2, 1, 1), (2, 1, 3, 3)):
+        model.turn = turn
+        model.shoot(i, j, target)
+    model.turn = 0
+    return model
+
+
+def _revealed(model: BattleshipModel) -> dict[tuple[int, int], bytes]:
+    return {pair: bytes(cells) for pair, cells in model.knowledge.all_maps().items()}
+
+
+def test_save_over_lazy_load_keeps_pending_maps(tmp_path: Path) -> None:
+    path = str(tmp_path / "match.bsv")
+    _match(1).save(path)
+
+    model = BattleshipModel.load(path, lazy=True)
+    # new maps that sort ahead of the pending ones shift them in the rewritten file
+    model.shoot(0, 0, 1)
+    model.turn = 1
+    model.shoot(0, 0, 0)
+    model.save(path)
+    assert model.knowledge.revealed(2, 1) == [(3, 3)]
+    assert model.knowledge.revealed(1, 2) == [(1, 1)]
+
+    reloaded = BattleshipModel.load(path, lazy=True)
+    assert _revealed(reloaded) == _revealed(model)
+    assert reloaded.grids() == model.grids()
+
+
+def test_other_lazy_loads_survive_a_rewrite(tmp_path: Path) -> None:
+    path = str(tmp_path / "match.bsv")
+    _match(1).save(path)
+    first = BattleshipModel.load(path, lazy=True)
+    expected = _revealed(BattleshipModel.load(path, lazy=False))
+
+    # a different, smaller save at the same path must not pull the mapped file out from under first
+    other = BattleshipModel(n=6, rng=Random(2))
+    other.setup(2)
+    other.save(path)
+    assert _revealed(first) == expected
+
+
+def _seeded(seed: int) -> BattleshipModel:
+    streams = RandomStreams(seed)
+    model = BattleshipModel(n=6, rng=streams.random("model"), players=3, streams=streams)
+    model.setup(3)
+    return model
+
+
+def _play(model: BattleshipModel, until: int | None = None) -> tuple[int, list[list[str]]]:
+    bots = [RandomBot(p) for p in range(model.players)]
+    while not model.is_game_over() and (until is None or model.turn_count < until):
+        bots[model.turn].take_turn(model)
+        model.go_to_next_turn()
+    return model.turn_count, model.grids()
+
+
+def test_resumed_game_plays_out_like_the_original(tmp_path: Path) -> None:
+    path = str(tmp_path / "match.bsv")
+    for seed in range(5):
+        finished = _play(_seeded(seed))
+        for until in range(0, finished[0], 7):
+            model = _seeded(seed)
+            _play(model, until)
+            model.save(path)
+            assert _play(BattleshipModel.load(path)) == finished, (seed, until)
+
+
+def test_lazy_load_unmaps_once_every_map_is_read(tmp_path: Path) -> None:
+    path = str(tmp_path / "match.bsv")
+    _match(1).save(path)
+    model = BattleshipModel.load(path, lazy=True)
+    assert model.knowledge.mapped is not None
+    _revealed(model)
+    assert model.knowledge.mapped is None and not model.knowledge.packed
+
+    # a save with no maps at all has nothing to map
+    fresh = BattleshipModel(n=6, rng=Random(2))
+    fresh.setup(2)
+    fresh.save(path)
+    assert BattleshipModel.load(path, lazy=True).knowledge.mapped is None
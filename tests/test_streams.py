@@ -0,0 +1,30 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from battleship.streams import RandomStreams
+
+
+def _draws(streams: RandomStreams, *path: int | str) -> list[float]:
+    rng = streams.random(*path)
+    return [rng.random() for _ in range(5)]
+
+
+def test_a_stream_depends_only_on_its_seed_and_path() -> None:
+    streams = RandomStreams(7)
+    alone = _draws(RandomStreams(7), 3, "placement", 1)
+    # drawing heavily from siblings first changes nothing
+    for game in range(4):
+        _draws(streams, game, "placement", 1)
+        _draws(streams, 3, "placement", 0)
+    assert _draws(streams, 3, "placement", 1) == alone
+    assert _draws(RandomStreams(7, 3), "placement", 1) == alone
+    assert _draws(RandomStreams(7).split(3, "placement"), 1) == alone
+
+
+def test_different_paths_give_different_streams() -> None:
+    streams = RandomStreams(7)
+    paths: list[tuple[int | str, ...]] = [(1,), ("1",), (1, 0), (0, 1), (2,)]
+    draws = [tuple(_draws(streams, *path)) for path in paths]
+    draws.append(tuple(_draws(RandomStreams(8), 1)))
+    assert len(set(draws)) == len(draws)
@@ -0,0 +1,33 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bots import BOT_VERSIONS
+from tournament import Tournament
+
+
+def _run(cache: Path) -> Tournament:
+    tournament = Tournament(["random", "heatmap"], [(6, 2, 2, (3, 2))], seed=1, cache_path=str(cache), block_games=4, max_games=8)
+    tournament.run()
+    return tournament
+
+
+def test_cached_blocks_are_not_replayed_until_a_bot_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = tmp_path / "cache.json"
+    first = _run(cache)
+    assert first.games_played > 0
+
+    second = _run(cache)
+    assert second.games_played == 0
+    assert second.games_cached == first.games_played
+    assert second.report()["configs"] == first.report()["configs"]
+
+    # a new heatmap version keys every block differently, so all of them are played again
+    monkeypatch.setitem(BOT_VERSIONS, "heatmap", BOT_VERSIONS["heatmap"] + 1)
+    third = _run(cache)
+    assert third.games_cached == 0
+    assert third.games_played == first.games_played
@@ -0,0 +1,24 @@
+# pyright: strict
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from battleship.utils import generate_grids_batch
+
+
+# a classic fleet stays on rejection sampling, a packed one needs the exact placement
+@pytest.mark.parametrize(("n", "ship_sizes"), [(8, (4, 3, 2, 2)), (5, (5, 5, 4, 4, 3))])
+def test_generate_grids_batch_places_every_ship(n: int, ship_sizes: tuple[int, ...]) -> None:
+    grids = generate_grids_batch(500, n, ship_sizes, seed=7)
+    assert grids.shape == (500, n, n)
+    assert grids.dtype == np.uint8
+    for ship_index, size in enumerate(ship_sizes):
+        cells = grids == ship_index + 1
+        assert (cells.sum(axis=(1, 2)) == size).all()
+        # one straight run, so every cell sits in a single row or a single column
+        rows = cells.any(axis=2).sum(axis=1)
+        cols = cells.any(axis=1).sum(axis=1)
+        assert (np.minimum(rows, cols) == 1).all() and (np.maximum(rows, cols) == size).all()
+    assert ((grids > 0).sum(axis=(1, 2)) == sum(ship_sizes)).all()
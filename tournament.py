@@ -0,0 +1,230 @@
+# pyright: strict
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+import argparse
+import json
+import math
+import os
+
+from battleship.model import BattleshipModel
+from battleship.streams import RandomStreams
+from bots import BOT_NAMES, BOT_VERSIONS, make_bot
+from simulate import play_game
+
+# (n, k, players, ship_sizes)
+Config = tuple[int, int, int, tuple[int, ...]]
+
+
+def config_label(config: Config) -> str:
+    n, k, players, ship_sizes = config
+    return f"n{n}-k{k}-p{players}-{'.'.join(map(str, ship_sizes))}"
+
+
+class PairingResult:
+    # games between strategies a and b, draws count half to each
+    def __init__(self, wins_a: int = 0, wins_b: int = 0, draws: int = 0):
+        self.wins_a = wins_a
+        self.wins_b = wins_b
+        self.draws = draws
+
+    @property
+    def games(self) -> int:
+        return self.wins_a + self.wins_b + self.draws
+
+    def add(self, other: PairingResult) -> None:
+        self.wins_a += other.wins_a
+        self.wins_b += other.wins_b
+        self.draws += other.draws
+
+    def score(self) -> float:
+        # a's expected score against b, starting from an even prior of one game
+        return (self.wins_a + self.draws / 2 + 0.5) / (self.games + 1)
+
+    def z(self) -> float:
+        # how many standard errors a's score sits from an even match, small means still undecided
+        p = self.score()
+        return abs(p - 0.5) / math.sqrt(p * (1 - p) / (self.games + 1))
+
+    def as_list(self) -> list[int]:
+        return [self.wins_a, self.wins_b, self.draws]
+
+
+def play_block(config: Config, a: str, b: str, seed: int, block: int, games: int, max_turns: int | None) -> PairingResult:
+    # seats alternate between the two strategies, and which one sits first alternates every game
+    n, k, players, ship_sizes = config
+    result = PairingResult()
+    for game in range(games):
+        streams = RandomStreams(seed, config_label(config), a, b, block, game)
+        model = BattleshipModel(n=n, k=k, ship_sizes=ship_sizes, rng=streams.random("model"), players=players, streams=streams)
+        model.setup(players)
+        seats = [(a, b)[(p + game) % 2] for p in range(players)]
+        bots = [make_bot(seats[p], p, model) for p in range(players)]
+        winner, _ = play_game(model, bots, max_turns)
+        for bot in bots:
+            bot.close()
+        if winner == -1:
+            result.draws += 1
+        elif seats[winner] == a:
+            result.wins_a += 1
+        else:
+            result.wins_b += 1
+    return result
+
+
+def _play_block(args: tuple[Config, str, str, int, int, int, int | None]) -> PairingResult:
+    return play_block(*args)
+
+
+class Tournament:
+    # round robin over every pair of strategies in every config, adding blocks of games
+    # to the pairings whose result is least decided until each is decided or out of games
+    def __init__(self,
+        strategies: Sequence[str],
+        configs: Sequence[Config],
+        seed: int = 0,
+        cache_path: str | None = None,
+        block_games: int = 20,
+        max_games: int = 400,
+        decided_z: float = 2.0,
+        max_turns: int | None = None,
+        workers: int = 1,
+        ):
+        self.strategies = list(strategies)
+        self.configs = list(configs)
+        self.seed = seed
+        self.cache_path = cache_path
+        self.block_games = block_games
+        self.max_games = max_games
+        self.decided_z = decided_z
+        self.max_turns = max_turns
+        self.workers = workers
+        self.games_played = 0
+        self.games_cached = 0
+
+        # finished blocks by cache key, a key names both strategy versions so a changed bot is replayed
+        self.cache: dict[str, list[int]] = {}
+        if cache_path is not None and os.path.exists(cache_path):
+            with open(cache_path) as f:
+                self.cache = json.load(f)
+
+        self.pairings: list[tuple[Config, str, str]] = [
+            (config, a, b)
+            for config in self.configs
+            for x, a in enumerate(self.strategies)
+            for b in self.strategies[x + 1:]
+        ]
+        self.results = {pairing: PairingResult() for pairing in self.pairings}
+        self.blocks = {pairing: 0 for pairing in self.pairings}
+
+    def _key(self, pairing: tuple[Config, str, str], block: int) -> str:
+        config, a, b = pairing
+        return json.dumps([config_label(config), a, BOT_VERSIONS.get(a, 0), b, BOT_VERSIONS.get(b, 0), self.seed, self.block_games, self.max_turns, block])
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        tmp = self.cache_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.cache, f)
+        os.replace(tmp, self.cache_path)
+
+    def _undecided(self) -> list[tuple[Config, str, str]]:
+        # pairings still worth a block, least decided first
+        open_pairings = [p for p in self.pairings if self.results[p].games < self.max_games and (self.blocks[p] == 0 or self.results[p].z() < self.decided_z)]
+        return sorted(open_pairings, key=lambda p: (self.results[p].z(), self.results[p].games))
+
+    def step(self, pool: ProcessPoolExecutor | None = None) -> bool:
+        # one round of at most `workers` blocks, returns False once every pairing is settled
+        chosen = self._undecided()[:self.workers]
+        if not chosen:
+            return False
+
+        todo: list[tuple[tuple[Config, str, str], str]] = []
+        for pairing in chosen:
+            key = self._key(pairing, self.blocks[pairing])
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.results[pairing].add(PairingResult(*cached))
+                self.games_cached += sum(cached)
+                self.blocks[pairing] += 1
+            else:
+                todo.append((pairing, key))
+
+        jobs = [(config, a, b, self.seed, self.blocks[(config, a, b)], self.block_games, self.max_turns) for (config, a, b), _ in todo]
+        played = list(pool.map(_play_block, jobs)) if pool is not None and len(jobs) > 1 else [_play_block(job) for job in jobs]
+        for (pairing, key), result in zip(todo, played):
+            self.cache[key] = result.as_list()
+            self.results[pairing].add(result)
+            self.games_played += result.games
+            self.blocks[pairing] += 1
+        if played:
+            self._save()
+        return True
+
+    def run(self) -> None:
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                while self.step(pool):
+                    pass
+        else:
+            while self.step():
+                pass
+
+    def ratings(self, config: Config, iterations: int = 200) -> dict[str, float]:
+        # Bradley-Terry strengths fitted to the pairwise scores, on the Elo scale around 1500
+        names = self.strategies
+        strength = {s: 1.0 for s in names}
+        for _ in range(iterations):
+            updated: dict[str, float] = {}
+            for s in names:
+                won, weight = 0.0, 0.0
+                for (c, a, b), result in self.results.items():
+                    if c != config or s not in (a, b):
+                        continue
+                    other = b if s == a else a
+                    score = result.score() if s == a else 1 - result.score()
+                    games = result.games + 1
+                    won += score * games
+                    weight += games / (strength[s] + strength[other])
+                updated[s] = won / weight if weight else strength[s]
+            mean = math.exp(sum(math.log(v) for v in updated.values()) / len(updated))
+            strength = {s: v / mean for s, v in updated.items()}
+        return {s: 1500 + 400 * math.log10(v) for s, v in strength.items()}
+
+    def report(self) -> dict[str, Any]:
+        configs: list[dict[str, Any]] = []
+        for config in self.configs:
+            pairings: list[dict[str, Any]] = []
+            for (c, a, b), result in self.results.items():
+                if c == config:
+                    pairings.append({"a": a, "b": b, "games": result.games, "wins_a": result.wins_a, "wins_b": result.wins_b, "draws": result.draws, "score_a": round(result.score(), 4), "z": round(result.z(), 2)})
+            ratings = self.ratings(config)
+            configs.append({"config": config_label(config), "ratings": {s: round(r, 1) for s, r in sorted(ratings.items(), key=lambda item: -item[1])}, "pairings": pairings})
+        return {"games_played": self.games_played, "games_cached": self.games_cached, "configs": configs}
+
+
+def main(argv: Sequence[str] | None = None, prog: str | None = None) -> None:
+    parser = argparse.ArgumentParser(prog=prog, description="Round-robin tournament between bot strategies")
+    parser.add_argument("--strategies", nargs="+", choices=BOT_NAMES, default=["random", "heatmap"])
+    parser.add_argument("--config", nargs="+", action="append", type=int, metavar="N K PLAYERS SHIP", help="board config as n k players ship sizes..., repeatable")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache", default="tournament_cache.json", help="finished blocks are kept here and never replayed")
+    parser.add_argument("--block-games", type=int, default=20)
+    parser.add_argument("--max-games", type=int, default=400, help="games per pairing at most")
+    parser.add_argument("--decided-z", type=float, default=2.0, help="stop a pairing once its score is this many standard errors from even")
+    parser.add_argument("--max-turns", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    configs: list[Config] = [(c[0], c[1], c[2], tuple(c[3:])) for c in args.config] if args.config else [(6, 2, 2, (4, 3, 2, 2))]
+    tournament = Tournament(args.strategies, configs, args.seed, args.cache, args.block_games, args.max_games, args.decided_z, args.max_turns, args.workers)
+    tournament.run()
+    print(json.dumps(tournament.report(), indent=2))
+
+
+if __name__ == "__main__":
+    main()